@@ -10,10 +10,11 @@ verifies the collection, and creates an ``ImageImportSession``.
 
 This module is intentionally narrow. It only (a) creates the dataset
 artifact (owner-only ACL) and (b) reads diverse local image formats
-(jpg/png/tif) from a mounted local folder and uploads them one at a time as
-PNG into ``images/``. Everything else (role metadata, presigned URL handout
-for annotators, label folder creation, ACL sharing, embeddings) is owned by
-the standing ``annotation-broker`` BioEngine app. Annotators never talk to
+(jpg/png/tif/ome-zarr) from a mounted local folder and uploads them one at a
+time into ``images/``, encoded according to an ``EncodingProfile``.
+Everything else (role metadata, presigned URL handout for annotators, label
+folder creation, ACL sharing, embeddings) is owned by the standing
+``annotation-broker`` BioEngine app. Annotators never talk to
 this service, and the host does not need to keep a tab open once a dataset
 is created and its images uploaded.
 
@@ -33,18 +34,58 @@ the artifact is created with an owner-only ACL.
 
 Supported image formats
 -----------------------
-Only the extensions listed in ``ImageFormat`` are accepted. Files with other
+Only the extensions listed in ``ImageFormat`` are accepted. TIFF, pyramidal
+OME-TIFF and OME-Zarr (a ``*.zarr`` directory, requires ``zarr``) are read
+plane by plane: one pyramid level and one plane are selected before any
+pixels are decoded, and large planes can be uploaded as tiles. Files with other
 extensions in a mounted local folder generate a console warning but are
-otherwise silently skipped.
+otherwise silently skipped. With ``recursive=True`` sub-folders are listed
+too and their relative paths are kept under ``images/``; folder listings
+are cached and only redone when a directory's mtime changes.
+
+Image encoding
+--------------
+Uploaded images are encoded according to the session's ``EncodingProfile``
+(``png-fast`` by default; ``png-balanced`` and ``webp-lossless`` trade encode
+time for smaller files). The profile, extension and MIME type are recorded
+under ``image_encoding`` in the artifact manifest so downstream consumers
+know what they are reading. ``benchmark_encoding`` reports encode time and
+size per profile on the mounted images.
+
+Alongside each ``images/{stem}.*`` the importer writes a small
+``image_stats/{stem}.json`` sidecar (source dtype, min/max, percentiles,
+coarse histogram, contrast limits), computed from the same pixel sample used
+for uint8 normalisation, so viewers can pick contrast without re-reading
+pixels.
+
+Headless use
+------------
+Under CPython the module doubles as a bulk importer::
+
+    HYPHA_TOKEN=... python colab_service.py /data/plate1 --recursive
+
+``_pyfetch`` then uses a pooled ``httpx`` client, images are decoded and
+encoded in a process pool, and several uploads run concurrently (see
+``bulk_import``). In every bulk import the presigned upload URLs of the
+next few images are requested ahead of the encoder (``UploadUrlPool``), so
+the ``put_file`` round trip is hidden behind decoding on high-latency links.
 """
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import io
+import json
+import os
+import sys
 import time
+from collections import deque
+from contextlib import contextmanager
 from enum import Enum
-from pathlib import Path
-from typing import List, Optional, Tuple
+from fnmatch import fnmatch
+from pathlib import Path, PurePosixPath
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -74,13 +115,47 @@ try:
     _pyodide_http_patch.patch_all()
     _pyfetch = _pyodide_http.pyfetch
     IN_PYODIDE = True
+
+    async def _close_http_client() -> None:
+        """No-op: pyfetch keeps no client of its own."""
 except ImportError:
     IN_PYODIDE = False
 
+    try:
+        import httpx  # type: ignore
+    except ImportError:
+        httpx = None  # type: ignore
+
+    # One pooled client per process, so concurrent uploads from the headless
+    # importer reuse keep-alive connections to the S3 endpoint.
+    HTTP_MAX_CONNECTIONS = 32
+    HTTP_TIMEOUT_SECONDS = 300.0
+    _http_client = None
+
     async def _pyfetch(url: str, method: str = "GET", body=None, **_):  # type: ignore
-        raise NotImplementedError(
-            "_pyfetch is not available outside Pyodide. Mock it in tests."
-        )
+        global _http_client
+        if httpx is None:
+            raise NotImplementedError(
+                "_pyfetch needs Pyodide or the 'httpx' package. Mock it in tests."
+            )
+        if _http_client is None:
+            _http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                ),
+                timeout=HTTP_TIMEOUT_SECONDS,
+            )
+        response = await _http_client.request(method, url, content=body)
+        response.raise_for_status()
+        return response
+
+    async def _close_http_client() -> None:
+        """Close the pooled client; the next request opens a new one."""
+        global _http_client
+        if _http_client is not None:
+            client, _http_client = _http_client, None
+            await client.aclose()
 
 try:
     from hypha_rpc import connect_to_server  # type: ignore
@@ -89,10 +164,15 @@ except ImportError:
 
 try:
     from PIL import Image  # type: ignore
-    from tifffile import imread as _tiffread  # type: ignore
+    from tifffile import TiffFile as _TiffFile  # type: ignore
 except ImportError:
     Image = None  # type: ignore
-    _tiffread = None  # type: ignore
+    _TiffFile = None  # type: ignore
+
+try:
+    import zarr  # type: ignore
+except ImportError:
+    zarr = None  # type: ignore
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -100,6 +180,9 @@ except ImportError:
 
 COLLECTION_ID = "bioimage-io/colab-annotations"
 ARTIFACT_WORKSPACE = "bioimage-io"
+# Per-image stats sidecars live beside ``images/`` (not inside it, where
+# every file is listed as an image): ``image_stats/{stem}.json``.
+STATS_DIR = "image_stats"
 
 
 class ImageFormat(str, Enum):
@@ -108,47 +191,483 @@ class ImageFormat(str, Enum):
     PNG = "png"
     TIF = "tif"
     TIFF = "tiff"
+    ZARR = "zarr"
 
 
 SUPPORTED_EXTENSIONS: frozenset[str] = frozenset(
     f".{fmt.value}" for fmt in ImageFormat
 )
 
+
+class EncodingProfile(str, Enum):
+    PNG_FAST = "png-fast"
+    PNG_BALANCED = "png-balanced"
+    WEBP_LOSSLESS = "webp-lossless"
+
+
+# Pillow format, output extension, MIME type and ``save()`` options per
+# profile. All profiles are lossless; they only trade encode time for size.
+# zlib level 1 is several times faster than Pillow's default level 6 for a
+# few percent more bytes, which matters under Pyodide's single thread.
+_ENCODERS = {
+    EncodingProfile.PNG_FAST: ("PNG", ".png", "image/png", {"compress_level": 1}),
+    EncodingProfile.PNG_BALANCED: ("PNG", ".png", "image/png", {"compress_level": 6}),
+    EncodingProfile.WEBP_LOSSLESS: (
+        "WEBP", ".webp", "image/webp", {"lossless": True, "method": 2}
+    ),
+}
+
+DEFAULT_ENCODING_PROFILE = EncodingProfile.PNG_FAST
+
 # ---------------------------------------------------------------------------
 # Image I/O helpers
 # ---------------------------------------------------------------------------
 
 
+# Cached results of :func:`list_image_files`, keyed by the listing
+# parameters. Each entry remembers the mtime of every directory it walked.
+# Adding, removing or renaming a file bumps its parent directory's mtime,
+# so a stale entry is detected with one ``stat`` per directory instead of a
+# full re-listing (slow on mounted network folders).
+_DIR_INDEX: Dict[tuple, Tuple[Dict[str, int], List[Path]]] = {}
+
+
+def _index_is_fresh(dir_mtimes: Dict[str, int]) -> bool:
+    try:
+        return all(os.stat(d).st_mtime_ns == m for d, m in dir_mtimes.items())
+    except OSError:
+        return False
+
+
+def _scan_folder(folder: Path, recursive: bool) -> Tuple[Dict[str, int], List[Path]]:
+    """Walk *folder* and return ``(dir_mtimes, files)``.
+
+    *files* are sorted paths relative to *folder*. Hidden sub-directories
+    are not descended into. Each directory's mtime is taken before it is
+    listed, so a change made during the scan invalidates the result.
+    """
+    dir_mtimes: Dict[str, int] = {}
+    files: List[Path] = []
+    pending = [Path()]
+    while pending:
+        rel_dir = pending.pop()
+        abs_dir = folder / rel_dir
+        try:
+            dir_mtimes[str(abs_dir)] = os.stat(abs_dir).st_mtime_ns
+            with os.scandir(abs_dir) as entries:
+                for entry in entries:
+                    # A Zarr store is a directory but counts as one image.
+                    if entry.is_file() or (
+                        entry.name.lower().endswith(".zarr") and entry.is_dir()
+                    ):
+                        files.append(rel_dir / entry.name)
+                    elif recursive and entry.is_dir() and not entry.name.startswith("."):
+                        pending.append(rel_dir / entry.name)
+        except OSError as exc:
+            if rel_dir == Path():
+                raise
+            console.warn(f"list_image_files: skipping {abs_dir}: {exc}")
+    files.sort()
+    return dir_mtimes, files
+
+
 def list_image_files(
     folder: Path,
+    recursive: bool = False,
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
 ) -> Tuple[List[Path], List[Path]]:
-    """Return ``(supported, unsupported)`` file lists from *folder* (non-recursive).
-
-    *supported* are files whose extension is in :data:`SUPPORTED_EXTENSIONS`.
-    *unsupported* are all other files (directories are ignored).
+    """Return ``(supported, unsupported)`` file lists from *folder*.
+
+    Paths are relative to *folder* so nested structure can be mirrored in
+    ``images/``. *supported* are files whose extension is in
+    :data:`SUPPORTED_EXTENSIONS`, plus ``*.zarr`` store directories.
+    *unsupported* are all other files (other directories are ignored).
+    With *recursive*, sub-directories are listed too. *include* / *exclude* are glob patterns matched against the
+    relative POSIX path (``*`` also matches ``/``); a file is kept if it
+    matches any *include* pattern (or none are given) and no *exclude*
+    pattern.
+
+    Listings are cached per parameter set and reused until the mtime of
+    any walked directory changes.
     """
+    include = tuple(include or ())
+    exclude = tuple(exclude or ())
+    key = (str(folder), recursive, include, exclude)
+    cached = _DIR_INDEX.get(key)
+    if cached is not None and _index_is_fresh(cached[0]):
+        files = cached[1]
+    else:
+        try:
+            dir_mtimes, files = _scan_folder(folder, recursive)
+        except Exception as exc:
+            console.error(f"list_image_files({folder}): {exc}")
+            return [], []
+        if include or exclude:
+            files = [
+                f for f in files
+                if (not include or any(fnmatch(f.as_posix(), pat) for pat in include))
+                and not any(fnmatch(f.as_posix(), pat) for pat in exclude)
+            ]
+        _DIR_INDEX[key] = (dir_mtimes, files)
+
     supported: List[Path] = []
     unsupported: List[Path] = []
-    try:
-        for entry in sorted(folder.iterdir()):
-            if not entry.is_file():
-                continue
-            if entry.suffix.lower() in SUPPORTED_EXTENSIONS:
-                supported.append(entry)
-            else:
-                unsupported.append(entry)
-    except Exception as exc:
-        console.error(f"list_image_files({folder}): {exc}")
+    for entry in files:
+        if entry.suffix.lower() in SUPPORTED_EXTENSIONS:
+            supported.append(entry)
+        else:
+            unsupported.append(entry)
     return supported, unsupported
 
 
-def _read_pil(path: Path) -> "np.ndarray":
+def _read_pil(
+    path: Path,
+    max_size: Optional[int] = None,
+    plane: Optional[dict] = None,
+    level: Optional[int] = None,
+) -> "np.ndarray":
     with Image.open(path) as img:
+        if max_size and max(img.size) > max_size:
+            # JPEG decodes at 1/2..1/8 scale in the DCT domain (no-op for
+            # other formats); draft keeps the result at least this large.
+            scale = max_size / max(img.size)
+            img.draft(img.mode, (int(img.width * scale), int(img.height * scale)))
+            factor = max(img.size) // max_size
+            if factor >= 2:
+                try:
+                    img = img.reduce(factor)
+                except ValueError:
+                    pass  # mode without reduce() support (e.g. I;16)
         return np.array(img)
 
 
-def _read_tiff(path: Path) -> "np.ndarray":
-    return _tiffread(str(path))
+# ---------------------------------------------------------------------------
+# Chunked / pyramidal sources (TIFF, OME-TIFF, OME-Zarr)
+# ---------------------------------------------------------------------------
+#
+# A source is opened as ``(axes, levels)``: an axes string such as
+# ``"TCZYX"`` and one array-like per pyramid level (finest first) whose
+# ``__getitem__`` decodes only the chunks a slice touches. One 2-D plane is
+# imported per file: every axis other than Y/X (and RGB samples, ``S``) is
+# fixed to an index from the ``plane`` option (``{"z": 10, "c": 1}``,
+# default 0), and the level is picked so the plane fits ``max_size``.
+
+# Contrast bounds of a tiled plane are estimated from a grid of
+# LAYOUT_SAMPLE_GRID x LAYOUT_SAMPLE_GRID windows of LAYOUT_SAMPLE_WINDOW
+# pixels on its coarsest pyramid level, rather than from the whole plane.
+LAYOUT_SAMPLE_GRID = 4
+LAYOUT_SAMPLE_WINDOW = 128
+
+
+def _read_page_region(page, y0: int, y1: int, x0: int, x1: int) -> "np.ndarray":
+    """Decode rows ``y0:y1`` and columns ``x0:x1`` of one TIFF page.
+
+    Only the tiles or strips overlapping the region are read and decoded.
+    Pages this cannot handle (volumetric tiles, unusual segment layouts)
+    are decoded whole and sliced.
+    """
+    keyframe = page.keyframe
+    n_sep, depth, length, width, n_contig = keyframe.shaped
+    if keyframe.is_tiled:
+        seg_h, seg_w = keyframe.tilelength, keyframe.tilewidth
+    else:
+        seg_h, seg_w = keyframe.rowsperstrip or length, width
+    rows, cols = -(-length // seg_h), -(-width // seg_w)
+    offsets, counts = page.dataoffsets, page.databytecounts
+    y_ax, x_ax = keyframe.axes.index("Y"), keyframe.axes.index("X")
+    if depth != 1 or len(offsets) != n_sep * rows * cols:
+        key = [slice(None)] * len(keyframe.shape)
+        key[y_ax], key[x_ax] = slice(y0, y1), slice(x0, x1)
+        return page.asarray()[tuple(key)]
+
+    wanted = [
+        (s * rows + r) * cols + c
+        for s in range(n_sep)
+        for r in range(y0 // seg_h, (y1 - 1) // seg_h + 1)
+        for c in range(x0 // seg_w, (x1 - 1) // seg_w + 1)
+    ]
+    out = np.zeros((n_sep, 1, y1 - y0, x1 - x0, n_contig), dtype=keyframe.dtype)
+    fh = page.parent.filehandle
+    for data, index in fh.read_segments(
+        [offsets[i] for i in wanted], [counts[i] for i in wanted], indices=wanted, lock=fh.lock
+    ):
+        segment, (s, _, sy, sx, _), _ = keyframe.decode(
+            data, index, jpegtables=keyframe.jpegtables, jpegheader=keyframe.jpegheader
+        )
+        if segment is None:  # sparse file: missing segments read as zero
+            continue
+        oy0, oy1 = max(sy, y0), min(sy + segment.shape[1], y1)
+        ox0, ox1 = max(sx, x0), min(sx + segment.shape[2], x1)
+        if oy0 < oy1 and ox0 < ox1:
+            out[s, 0, oy0 - y0 : oy1 - y0, ox0 - x0 : ox1 - x0] = segment[
+                0, oy0 - sy : oy1 - sy, ox0 - sx : ox1 - sx
+            ]
+    shape = list(keyframe.shape)
+    shape[y_ax], shape[x_ax] = y1 - y0, x1 - x0
+    return out.reshape(shape)
+
+
+class _TiffLevel:
+    """Array-like view of one TIFF pyramid level that decodes single pages.
+
+    Used when ``zarr`` is not installed (as in the browser kernel); indexing
+    decodes only the page holding the requested plane, and of that page
+    only the tiles or strips overlapping the requested Y/X region (see
+    :func:`_read_page_region`).
+    """
+
+    def __init__(self, series) -> None:
+        self._series = series
+        self.shape = tuple(series.shape)
+        self.dtype = series.dtype
+        self._page_axes = series.keyframe.axes
+        self._page_ndim = len(series.keyframe.shape)
+
+    def __getitem__(self, key: tuple) -> "np.ndarray":
+        n_lead = len(self.shape) - self._page_ndim
+        lead = self.shape[:n_lead]
+        index = int(np.ravel_multi_index(key[:n_lead], lead)) if lead else 0
+        page = self._series.pages[index]
+        page_key = list(key[n_lead:])
+        y_ax, x_ax = self._page_axes.index("Y"), self._page_axes.index("X")
+        height, width = self.shape[n_lead + y_ax], self.shape[n_lead + x_ax]
+        ys = page_key[y_ax].indices(height)
+        xs = page_key[x_ax].indices(width)
+        if ys[2] != 1 or xs[2] != 1:
+            return page.asarray()[tuple(page_key)]
+        if (ys[0], ys[1], xs[0], xs[1]) == (0, height, 0, width):
+            data = page.asarray()
+        else:
+            data = _read_page_region(page, ys[0], ys[1], xs[0], xs[1])
+        page_key[y_ax] = page_key[x_ax] = slice(None)
+        return data[tuple(page_key)]
+
+
+def _axes_from_ome(multiscale: dict, ndim: int) -> str:
+    axes = multiscale.get("axes")
+    if not axes:
+        return "TCZYX"[-ndim:]
+    return "".join(
+        (ax["name"] if isinstance(ax, dict) else str(ax))[0].upper() for ax in axes
+    )
+
+
+@contextmanager
+def _open_pyramid(path: Path) -> Iterator[Tuple[str, list]]:
+    """Open a TIFF or Zarr source as ``(axes, levels)`` without reading pixels."""
+    if path.suffix.lower() == ".zarr":
+        if zarr is None:
+            raise ValueError(f"Reading {path.name} requires the 'zarr' package")
+        root = zarr.open(str(path), mode="r")
+        if hasattr(root, "shape"):  # bare array store, no OME metadata
+            yield "TCZYX"[-root.ndim:], [root]
+            return
+        attrs = dict(root.attrs)
+        multiscales = attrs.get("multiscales") or attrs.get("ome", {}).get("multiscales")
+        if not multiscales:
+            raise ValueError(f"{path.name} has no OME-Zarr 'multiscales' metadata")
+        levels = [root[ds["path"]] for ds in multiscales[0]["datasets"]]
+        yield _axes_from_ome(multiscales[0], levels[0].ndim), levels
+        return
+
+    with _TiffFile(str(path)) as tif:
+        series = tif.series[0]
+        levels: list = []
+        for i, level in enumerate(series.levels):
+            try:
+                if zarr is None:
+                    raise ImportError("zarr")
+                levels.append(zarr.open(series.aszarr(level=i), mode="r"))
+            except Exception:
+                levels.append(_TiffLevel(level))
+        yield series.axes.upper(), levels
+
+
+def _select_level(
+    axes: str, levels: list, max_size: Optional[int], level: Optional[int]
+) -> int:
+    """Explicit *level*, else the finest level whose plane fits *max_size*
+    (the coarsest if none does), else level 0."""
+    if level is not None:
+        return min(max(int(level), 0), len(levels) - 1)
+    if not max_size:
+        return 0
+    for i, arr in enumerate(levels):
+        if max(_plane_size(axes, arr.shape)) <= max_size:
+            return i
+    return len(levels) - 1
+
+
+def _plane_key(
+    axes: str,
+    shape: Sequence[int],
+    plane: Optional[dict],
+    region: Optional[Tuple[int, int, int, int]] = None,
+) -> tuple:
+    """Index tuple selecting one plane (optionally a ``(y0, y1, x0, x1)`` region)."""
+    plane = {str(k).upper(): v for k, v in (plane or {}).items()}
+    key: list = []
+    for ax, n in zip(axes, shape):
+        if ax == "Y":
+            key.append(slice(region[0], region[1]) if region else slice(None))
+        elif ax == "X":
+            key.append(slice(region[2], region[3]) if region else slice(None))
+        elif ax == "S":
+            key.append(slice(None))
+        else:
+            key.append(min(max(int(plane.get(ax, 0)), 0), n - 1))
+    return tuple(key)
+
+
+def _plane_size(axes: str, shape: Sequence[int]) -> Tuple[int, int]:
+    return shape[axes.index("Y")], shape[axes.index("X")]
+
+
+def _plane_array(
+    axes: str,
+    arr,
+    plane: Optional[dict],
+    region: Optional[Tuple[int, int, int, int]] = None,
+) -> "np.ndarray":
+    """Decode one plane (or region) of *arr* as ``(y, x)`` or ``(y, x, s)``.
+
+    The ``S`` (RGB samples) axis is moved last using the known *axes*, so
+    planar ``SYX`` sources do not depend on the shape heuristic in
+    :func:`_normalise`, which thin edge tiles would defeat.
+    """
+    data = np.asarray(arr[_plane_key(axes, arr.shape, plane, region)])
+    kept = [ax for ax in axes if ax in "YXS"]
+    if "S" in kept and kept[-1] != "S":
+        data = np.moveaxis(data, kept.index("S"), -1)
+    return data
+
+
+def _box_reduce(arr: "np.ndarray", factor: int) -> "np.ndarray":
+    """Average *factor* x *factor* blocks of a ``(y, x[, s])`` array.
+
+    Edge blocks are padded by repeating the last row/column. Bool inputs
+    are thresholded at 0.5 and other dtypes keep their dtype.
+    """
+    pad_y, pad_x = -arr.shape[0] % factor, -arr.shape[1] % factor
+    if pad_y or pad_x:
+        arr = np.pad(arr, [(0, pad_y), (0, pad_x)] + [(0, 0)] * (arr.ndim - 2), mode="edge")
+    h, w = arr.shape[0] // factor, arr.shape[1] // factor
+    blocks = arr.reshape(h, factor, w, factor, *arr.shape[2:])
+    mean = blocks.mean(axis=(1, 3), dtype=np.float32)
+    if arr.dtype.kind == "b":
+        return mean >= 0.5
+    if arr.dtype.kind in "iu":
+        np.rint(mean, out=mean)
+    return mean.astype(arr.dtype)
+
+
+# Pixels decoded per band when a plane larger than max_size is box-reduced
+# while reading (see :func:`read_plane`).
+DOWNSCALE_BAND_PIXELS = 1 << 20
+
+
+def read_plane(
+    path: Path,
+    max_size: Optional[int] = None,
+    plane: Optional[dict] = None,
+    level: Optional[int] = None,
+    region: Optional[Tuple[int, int, int, int]] = None,
+) -> "np.ndarray":
+    """Decode one plane of a TIFF/OME-TIFF/OME-Zarr source as ``(y, x[, s])``.
+
+    Only the selected pyramid level and plane (and *region*, if given) are
+    read; with ``zarr`` installed, only the chunks/tiles they overlap. If
+    even the selected level is at least twice *max_size* (e.g. a
+    single-level file), the plane is read in row bands that are each
+    box-reduced by the integer factor that keeps it at or above
+    *max_size*, so the full-resolution plane is never held in memory.
+    """
+    with _open_pyramid(path) as (axes, levels):
+        arr = levels[_select_level(axes, levels, max_size, level)]
+        height, width = _plane_size(axes, arr.shape)
+        factor = max(height, width) // max_size if max_size else 1
+        if region is not None or factor < 2:
+            return _plane_array(axes, arr, plane, region)
+        band = factor * max(1, DOWNSCALE_BAND_PIXELS // (width * factor))
+        return np.concatenate(
+            [
+                _box_reduce(
+                    _plane_array(axes, arr, plane, (y0, min(y0 + band, height), 0, width)),
+                    factor,
+                )
+                for y0 in range(0, height, band)
+            ]
+        )
+
+
+def plane_tiles(
+    path: Path,
+    tile_size: int,
+    max_size: Optional[int] = None,
+    plane: Optional[dict] = None,
+    level: Optional[int] = None,
+) -> Iterator[Tuple[int, int, "np.ndarray"]]:
+    """Yield ``(row, col, tile)`` for the selected plane in row-major order.
+
+    Each tile is at most *tile_size* square, shaped ``(y, x[, s])``, and is
+    decoded on its own, so memory stays bounded by one tile regardless of
+    the plane size.
+    """
+    with _open_pyramid(path) as (axes, levels):
+        arr = levels[_select_level(axes, levels, max_size, level)]
+        height, width = _plane_size(axes, arr.shape)
+        for row, y0 in enumerate(range(0, height, tile_size)):
+            for col, x0 in enumerate(range(0, width, tile_size)):
+                region = (y0, min(y0 + tile_size, height), x0, min(x0 + tile_size, width))
+                yield row, col, _plane_array(axes, arr, plane, region)
+
+
+def _plane_layout(
+    path: Path,
+    max_size: Optional[int] = None,
+    plane: Optional[dict] = None,
+    level: Optional[int] = None,
+) -> Tuple[Tuple[int, int], Tuple[float, float]]:
+    """Return ``((height, width), bounds)`` of the selected plane.
+
+    The contrast bounds are estimated once per plane, so that all its tiles
+    are stretched identically, from the coarsest pyramid level. If that
+    level is larger than the sampling grid (e.g. a single-level file), only
+    ``LAYOUT_SAMPLE_GRID`` x ``LAYOUT_SAMPLE_GRID`` evenly spaced windows of
+    ``LAYOUT_SAMPLE_WINDOW`` pixels are read, so memory stays bounded.
+    """
+    with _open_pyramid(path) as (axes, levels):
+        arr = levels[_select_level(axes, levels, max_size, level)]
+        coarse = levels[-1]
+        height, width = _plane_size(axes, coarse.shape)
+        span = LAYOUT_SAMPLE_GRID * LAYOUT_SAMPLE_WINDOW
+        if height <= span and width <= span:
+            regions: list = [None]
+        else:
+            win_h, win_w = min(LAYOUT_SAMPLE_WINDOW, height), min(LAYOUT_SAMPLE_WINDOW, width)
+            ys = np.unique(np.linspace(0, height - win_h, LAYOUT_SAMPLE_GRID).astype(int))
+            xs = np.unique(np.linspace(0, width - win_w, LAYOUT_SAMPLE_GRID).astype(int))
+            regions = [(y, y + win_h, x, x + win_w) for y in ys for x in xs]
+        sample = np.concatenate(
+            [
+                _intensity_sample(_plane_array(axes, coarse, plane, region)).ravel()
+                for region in regions
+            ]
+        )
+        return _plane_size(axes, arr.shape), _percentile_bounds(sample)
+
+
+def _read_tiff(
+    path: Path,
+    max_size: Optional[int] = None,
+    plane: Optional[dict] = None,
+    level: Optional[int] = None,
+) -> "np.ndarray":
+    # Pyramid level and plane are picked before decoding and oversized
+    # planes are box-reduced while reading; any remaining size cap is
+    # applied by the filtered resize in _normalise.
+    return read_plane(path, max_size, plane, level)
 
 
 _READERS = {
@@ -157,39 +676,603 @@ _READERS = {
     ".png": _read_pil,
     ".tif": _read_tiff,
     ".tiff": _read_tiff,
+    ".zarr": _read_tiff,
 }
 
+# Formats read through :func:`_open_pyramid`, which can be imported as tiles.
+_CHUNKED_EXTENSIONS = frozenset({".tif", ".tiff", ".zarr"})
+
+
+# numpy dtype and channel count that ``np.array(img)`` yields per PIL mode.
+_PIL_MODES = {
+    "1": ("bool", 1),
+    "L": ("uint8", 1),
+    "P": ("uint8", 1),
+    "LA": ("uint8", 2),
+    "RGB": ("uint8", 3),
+    "YCbCr": ("uint8", 3),
+    "RGBA": ("uint8", 4),
+    "CMYK": ("uint8", 4),
+    "I;16": ("uint16", 1),
+    "I;16L": ("uint16", 1),
+    "I;16B": ("uint16", 1),
+    "I": ("int32", 1),
+    "F": ("float32", 1),
+}
 
-def _process_image(arr: "np.ndarray") -> "np.ndarray":
-    """Normalise to HWC RGB uint8."""
+
+def _meta_pil(path: Path) -> dict:
+    # Image.open only parses the header; pixels are decoded on first access.
+    with Image.open(path) as img:
+        dtype, channels = _PIL_MODES.get(img.mode, ("uint8", len(img.getbands())))
+        return {
+            "width": img.width,
+            "height": img.height,
+            "dtype": dtype,
+            "channels": channels,
+            "pages": getattr(img, "n_frames", 1),
+        }
+
+
+def _axes_meta(axes: str, shape: Sequence[int], dtype, levels: int) -> dict:
+    """Metadata of a source with the given axes and level-0 shape.
+
+    Channels are the product of the ``C`` and ``S`` (RGB samples) axes and
+    pages the product of all other non-Y/X axes.
+    """
+    height, width = _plane_size(axes, shape)
+    return {
+        "width": int(width),
+        "height": int(height),
+        "dtype": str(np.dtype(dtype)),
+        "channels": int(np.prod([n for ax, n in zip(axes, shape) if ax in "CS"])),
+        "pages": int(np.prod([n for ax, n in zip(axes, shape) if ax not in "CSYX"])),
+        "axes": axes,
+        "levels": levels,
+    }
+
+
+def _meta_tiff(path: Path) -> dict:
+    # Only IFD tags are read. The first series gives the image axes (e.g.
+    # ZCYX for OME/ImageJ stacks), so pages holding channels or pyramid
+    # levels are not counted as planes.
+    with _TiffFile(str(path)) as tif:
+        series = tif.series[0]
+        return _axes_meta(series.axes.upper(), series.shape, series.dtype, len(series.levels))
+
+
+def _meta_zarr(path: Path) -> dict:
+    # Only the .zattrs/.zarray (or zarr.json) metadata is read.
+    with _open_pyramid(path) as (axes, levels):
+        return _axes_meta(axes, levels[0].shape, levels[0].dtype, len(levels))
+
+
+_META_READERS = {
+    ".jpeg": _meta_pil,
+    ".jpg": _meta_pil,
+    ".png": _meta_pil,
+    ".tif": _meta_tiff,
+    ".tiff": _meta_tiff,
+    ".zarr": _meta_zarr,
+}
+
+# Header metadata per file, keyed by path and reused while the file's size
+# and mtime are unchanged.
+_META_CACHE: Dict[str, Tuple[int, int, dict]] = {}
+
+
+def read_image_metadata(path: Path) -> dict:
+    """Return header metadata for *path* without decoding any pixels.
+
+    Keys: ``width``, ``height``, ``dtype`` (numpy name of the decoded
+    array), ``channels``, ``pages``, ``file_size`` and ``decoded_bytes``
+    (in-memory size of all pages once decoded); TIFF and Zarr sources add
+    ``axes`` and pyramid ``levels``. ``file_size`` is ``None`` for Zarr
+    store directories. Raises ``ValueError`` for unsupported extensions.
+    """
+    reader = _META_READERS.get(path.suffix.lower())
+    if reader is None:
+        raise ValueError(f"Unsupported extension: {path.suffix}")
+    st = os.stat(path)
+    cached = _META_CACHE.get(str(path))
+    if cached is not None and cached[:2] == (st.st_size, st.st_mtime_ns):
+        return dict(cached[2])
+    meta = reader(path)
+    meta["file_size"] = None if path.is_dir() else st.st_size
+    meta["decoded_bytes"] = (
+        meta["width"] * meta["height"] * meta["channels"] * meta["pages"]
+        * np.dtype(meta["dtype"]).itemsize
+    )
+    _META_CACHE[str(path)] = (st.st_size, st.st_mtime_ns, meta)
+    return dict(meta)
+
+
+# Intensity bounds used when stretching non-uint8 images to uint8. Clipping
+# at percentiles rather than min/max keeps a single hot pixel from flattening
+# the contrast of the whole image.
+NORM_LOW_PERCENTILE = 0.1
+NORM_HIGH_PERCENTILE = 99.9
+# Upper bound on the number of pixels sampled (by stride) to estimate the
+# percentile bounds, so the estimate costs the same on a 4 GB stack as on a
+# thumbnail.
+NORM_MAX_SAMPLES = 1 << 20
+# Percentiles and histogram resolution recorded in the per-image stats
+# sidecar (see :func:`read_image_with_stats`).
+STATS_PERCENTILES = (0.1, 1.0, 50.0, 99.0, 99.9)
+STATS_HISTOGRAM_BINS = 64
+
+
+def _intensity_sample(arr: "np.ndarray") -> "np.ndarray":
+    """Strided subsample of at most :data:`NORM_MAX_SAMPLES` finite pixels."""
+    step = max(1, arr.size // NORM_MAX_SAMPLES)
+    sample = arr.flat[::step]
+    if sample.dtype.kind == "f":
+        sample = sample[np.isfinite(sample)]
+    return sample
+
+
+def _sample_percentiles(sample: "np.ndarray", qs: Sequence[float]) -> List[float]:
+    """Percentiles *qs* of *sample*.
+
+    Integer samples of up to 16 bits go through an ``np.bincount``
+    histogram; everything else through ``np.percentile``.
+    """
+    if sample.dtype.kind in "iu" and sample.dtype.itemsize <= 2:
+        offset = int(np.iinfo(sample.dtype).min)
+        cdf = np.cumsum(np.bincount(sample.astype(np.int32) - offset))
+        total = cdf[-1]
+        return [
+            float(offset + np.searchsorted(cdf, max(total * q / 100, 1), side="left"))
+            for q in qs
+        ]
+    return [float(v) for v in np.percentile(sample.astype(np.float32), qs)]
+
+
+def _percentile_bounds(sample: "np.ndarray") -> Tuple[float, float]:
+    """Return ``(lo, hi)`` intensity bounds for uint8 conversion.
+
+    Falls back to min/max when the percentiles collapse, e.g. for sparse
+    bright spots on a flat background.
+    """
+    if sample.size == 0:
+        return 0.0, 0.0
+    lo, hi = _sample_percentiles(sample, [NORM_LOW_PERCENTILE, NORM_HIGH_PERCENTILE])
+    if hi <= lo:
+        lo, hi = sample.min(), sample.max()
+    return float(lo), float(hi)
+
+
+def _to_uint8(arr: "np.ndarray", lo: float, hi: float) -> "np.ndarray":
+    """Linearly stretch *arr* between *lo* and *hi* into uint8.
+
+    Integer inputs of up to 16 bits are mapped through a precomputed lookup
+    table (at most 65536 entries), so the only full-size allocation is the
+    uint8 output. Wider integers and floats are converted once to float32
+    and scaled in place, never promoting to float64.
+    """
+    if hi <= lo:
+        return np.zeros(arr.shape, dtype=np.uint8)
+    scale = np.float32(255.0 / (hi - lo))
+    if arr.dtype.kind in "iu" and arr.dtype.itemsize <= 2:
+        # Table index i holds the level for the value whose bit pattern is i;
+        # for signed dtypes negative values index from the end, which is
+        # exactly where the wrap-around of ``arange(...).astype`` puts them.
+        levels = np.arange(1 << (8 * arr.dtype.itemsize)).astype(arr.dtype).astype(np.float32)
+        levels -= np.float32(lo)
+        levels *= scale
+        np.clip(levels, 0, 255, out=levels)
+        return levels.astype(np.uint8)[arr]
+    out = arr.astype(np.float32)
+    out -= np.float32(lo)
+    out *= scale
+    np.clip(out, 0, 255, out=out)
+    np.nan_to_num(out, copy=False)
+    return out.astype(np.uint8)
+
+
+def _image_stats(
+    source: "np.ndarray", sample: "np.ndarray", bounds: Optional[Tuple[float, float]]
+) -> dict:
+    """Stats sidecar entry for one image.
+
+    *source* is the decoded array before channel selection and resizing; its
+    dtype, shape and (for integers, exact) min/max are recorded. Percentiles
+    and histogram come from the *sample* already taken for normalisation.
+    *bounds* are the contrast limits applied, or None if the image was
+    uploaded unstretched.
+    """
+    dtype = str(source.dtype)
+    if sample.size == 0:
+        return {"dtype": dtype, "shape": list(source.shape), "empty": True}
+    # Integer reductions need no temporaries; float min/max are sampled so
+    # NaN/inf pixels are skipped without a full-size mask.
+    finite = source if source.dtype.kind != "f" else sample
+    vmin, vmax = float(finite.min()), float(finite.max())
+    counts, edges = np.histogram(
+        sample.astype(np.float32), bins=STATS_HISTOGRAM_BINS, range=(vmin, vmax if vmax > vmin else vmin + 1)
+    )
+    stats = {
+        "dtype": dtype,
+        "shape": list(source.shape),
+        "min": vmin,
+        "max": vmax,
+        "percentiles": {
+            f"{q:g}": v for q, v in zip(STATS_PERCENTILES, _sample_percentiles(sample, STATS_PERCENTILES))
+        },
+        "histogram": {
+            "range": [float(edges[0]), float(edges[-1])],
+            "counts": counts.tolist(),
+        },
+        "sampled_pixels": int(sample.size),
+        # uint8 and bool (mask) sources are not stretched and have no
+        # contrast limits.
+        "stretched": bounds is not None,
+    }
+    if bounds is not None:
+        # Bounds (in source units) mapped to 0..255 in the uploaded image.
+        stats["contrast_limits"] = [bounds[0], bounds[1]]
+    return stats
+
+
+def _normalise(
+    arr: "np.ndarray",
+    with_stats: bool,
+    max_size: Optional[int] = None,
+    bounds: Optional[Tuple[float, float]] = None,
+) -> Tuple["np.ndarray", Optional[dict]]:
+    """Normalise to HWC RGB uint8, optionally returning the stats entry.
+
+    Channels are selected before intensity normalisation, and grayscale is
+    only expanded to RGB afterwards, so the stretch runs once per pixel on
+    the smallest array. The strided sample used for the contrast bounds is
+    reused for the stats, so no extra pass over the pixels is needed. If
+    the image is still larger than *max_size* (the readers only pre-shrink
+    by integer factors that keep it at least that large), the uint8 result
+    is resized with a Lanczos filter so its longer side is exactly
+    *max_size*. Fixed *bounds* (e.g. shared by all tiles
+    of a plane) replace the per-image percentile bounds.
+    """
+    source = arr
     if arr.ndim == 3:
         if arr.shape[0] in (1, 3, 4) and arr.shape[0] < arr.shape[1] and arr.shape[0] < arr.shape[2]:
             arr = np.transpose(arr, (1, 2, 0))
-    if arr.ndim == 2:
-        arr = np.stack([arr] * 3, axis=-1)
-    elif arr.ndim == 3:
+    if arr.ndim == 3:
         c = arr.shape[2]
-        if c == 1:
-            arr = np.concatenate([arr] * 3, axis=-1)
+        if c in (1, 2):
+            arr = arr[..., 0]
         elif c == 4:
             arr = arr[..., :3]
-        elif c == 2:
-            arr = np.stack([arr[..., 0]] * 3, axis=-1)
-    if arr.dtype != np.uint8:
-        lo, hi = arr.min(), arr.max()
-        if hi > lo:
-            arr = ((arr - lo) / (hi - lo) * 255).astype(np.uint8)
-        else:
-            arr = np.zeros_like(arr, dtype=np.uint8)
-    return arr
+    # Masks are not stretched: True maps to 255 below.
+    stretched = arr.dtype != np.uint8 and arr.dtype.kind != "b"
+    stats = None
+    if stretched or with_stats:
+        sample = _intensity_sample(arr)
+        if stretched and bounds is None:
+            bounds = _percentile_bounds(sample)
+        if with_stats:
+            stats = _image_stats(source, sample, bounds if stretched else None)
+        if stretched:
+            arr = _to_uint8(arr, *bounds)
+    if arr.dtype.kind == "b":
+        arr = arr.view(np.uint8) * np.uint8(255)
+    if max_size and max(arr.shape[:2]) > max_size:
+        img = Image.fromarray(arr)
+        img.thumbnail((max_size, max_size), Image.LANCZOS)
+        arr = np.asarray(img)
+    if arr.ndim == 2:
+        arr = np.stack([arr] * 3, axis=-1)
+    return arr, stats
+
 
+def _process_image(arr: "np.ndarray") -> "np.ndarray":
+    """Normalise to HWC RGB uint8."""
+    return _normalise(arr, with_stats=False)[0]
 
-def read_image(path: Path) -> "np.ndarray":
-    """Read *path* and return an HWC RGB uint8 numpy array."""
+
+def _read_raw(
+    path: Path,
+    max_size: Optional[int] = None,
+    plane: Optional[dict] = None,
+    level: Optional[int] = None,
+) -> "np.ndarray":
     reader = _READERS.get(path.suffix.lower())
     if reader is None:
         raise ValueError(f"Unsupported extension: {path.suffix}")
-    return _process_image(reader(path))
+    return reader(path, max_size, plane, level)
+
+
+def read_image(
+    path: Path,
+    max_size: Optional[int] = None,
+    plane: Optional[dict] = None,
+    level: Optional[int] = None,
+) -> "np.ndarray":
+    """Read *path* and return an HWC RGB uint8 numpy array.
+
+    With *max_size*, the longer side of the result is at most *max_size*
+    pixels. JPEGs are downscaled during decoding via PIL ``draft()`` and
+    other PIL formats via ``reduce()`` before conversion to NumPy, which
+    cuts decode time and peak memory by up to 8x for camera JPEGs. For
+    TIFF/OME-TIFF/OME-Zarr, *plane* and *level* select what is decoded
+    (see :func:`read_plane`).
+    """
+    raw = _read_raw(path, max_size, plane, level)
+    return _normalise(raw, with_stats=False, max_size=max_size)[0]
+
+
+def read_image_with_stats(
+    path: Path,
+    max_size: Optional[int] = None,
+    plane: Optional[dict] = None,
+    level: Optional[int] = None,
+) -> Tuple["np.ndarray", dict]:
+    """Like :func:`read_image`, also returning the per-image stats entry.
+
+    The stats describe the decoded source: its ``dtype`` and ``shape``
+    (before channel selection and the *max_size* resize, but after any
+    level or plane selection and decode-time downscaling) and ``min``/``max``
+    (exact over all its pixels for integer sources, sampled for floats).
+    ``percentiles`` and a coarse ``histogram`` are estimated from the
+    normalisation sample of the uploaded channels. ``contrast_limits``
+    (the bounds mapped to 0..255) is present only if the image was
+    stretched, i.e. for non-uint8 sources.
+    """
+    raw = _read_raw(path, max_size, plane, level)
+    return _normalise(raw, with_stats=True, max_size=max_size)
+
+
+def encode_image(arr: "np.ndarray", profile: EncodingProfile) -> bytes:
+    """Encode an HWC RGB uint8 array with the given :class:`EncodingProfile`."""
+    fmt, _, _, options = _ENCODERS[profile]
+    buf = io.BytesIO()
+    Image.fromarray(arr, mode="RGB").save(buf, format=fmt, **options)
+    return buf.getvalue()
+
+
+def benchmark_encoding_profiles(
+    paths: List[Path], repeat: int = 3
+) -> List[dict]:
+    """Time every :class:`EncodingProfile` on the images in *paths*.
+
+    Each image is decoded once; the encode is repeated *repeat* times and
+    the fastest run is kept. Returns one dict per profile with
+    ``profile``, ``images``, ``encode_seconds`` (summed over images),
+    ``bytes`` (summed), ``raw_bytes`` (decoded RGB size) and ``ratio``
+    (``bytes / raw_bytes``).
+    """
+    arrays = []
+    for path in paths:
+        try:
+            arrays.append(read_image(path))
+        except Exception as exc:
+            console.warn(f"benchmark_encoding_profiles: skipping {path.name}: {exc}")
+    raw_bytes = sum(arr.nbytes for arr in arrays)
+
+    results: List[dict] = []
+    for profile in EncodingProfile:
+        seconds = 0.0
+        size = 0
+        for arr in arrays:
+            best = float("inf")
+            for _ in range(max(1, repeat)):
+                start = time.perf_counter()
+                data = encode_image(arr, profile)
+                best = min(best, time.perf_counter() - start)
+            seconds += best
+            size += len(data)
+        results.append(
+            {
+                "profile": profile.value,
+                "images": len(arrays),
+                "encode_seconds": round(seconds, 4),
+                "bytes": size,
+                "raw_bytes": raw_bytes,
+                "ratio": round(size / raw_bytes, 4) if raw_bytes else 0.0,
+            }
+        )
+        console.log(
+            f"benchmark_encoding_profiles: {profile.value}: "
+            f"{seconds:.3f}s, {size} bytes for {len(arrays)} image(s)"
+        )
+    return results
+
+
+def prepare_image(
+    path: Path, name: str, options: dict
+) -> List[Tuple[str, bytes, Optional[dict]]]:
+    """Decode and encode one source file into upload-ready images.
+
+    Pure CPU work with picklable arguments, so the headless importer can
+    run it in a process pool. *name* is the target name under ``images/``
+    and *options* the session's import options (``encoding_profile``,
+    ``write_stats``, ``max_image_size``, ``plane``, ``pyramid_level``,
+    ``tile_size``). Returns ``[(name, data, stats)]`` with one entry, or
+    one per tile (named ``{stem}_r{row}_c{col}``) when the plane is tiled.
+    """
+    profile = EncodingProfile(options.get("encoding_profile", DEFAULT_ENCODING_PROFILE))
+    with_stats = options.get("write_stats", True)
+    max_size = options.get("max_image_size")
+    plane = options.get("plane")
+    level = options.get("pyramid_level")
+    tile_size = options.get("tile_size")
+
+    if tile_size and path.suffix.lower() in _CHUNKED_EXTENSIONS:
+        (height, width), bounds = _plane_layout(path, max_size, plane, level)
+        if max(height, width) > tile_size:
+            stem = PurePosixPath(name).with_suffix("").as_posix()
+            ext = _ENCODERS[profile][1]
+            prepared = []
+            for row, col, raw in plane_tiles(path, tile_size, max_size, plane, level):
+                arr, stats = _normalise(raw, with_stats, bounds=bounds)
+                prepared.append(
+                    (f"{stem}_r{row:03d}_c{col:03d}{ext}", encode_image(arr, profile), stats)
+                )
+            return prepared
+
+    raw = _read_raw(path, max_size, plane, level)
+    arr, stats = _normalise(raw, with_stats, max_size)
+    del raw
+    return [(name, encode_image(arr, profile), stats)]
+
+
+# ---------------------------------------------------------------------------
+# Import progress
+# ---------------------------------------------------------------------------
+
+# Throughput and ETA are computed over the completions of the last
+# PROGRESS_WINDOW_SECONDS, so a stall shows up as a falling rate instead of
+# being averaged away over a long import.
+PROGRESS_WINDOW_SECONDS = 10.0
+# Minimum spacing between progress callbacks; the final event is always sent.
+PROGRESS_MIN_INTERVAL_SECONDS = 0.5
+
+
+class ImportProgress:
+    """Counters and windowed throughput for one bulk import.
+
+    :meth:`snapshot` returns the event dict sent to progress callbacks:
+    ``images_total``, ``images_done``, ``success``, ``failed``,
+    ``bytes_uploaded``, ``current`` (last file), ``elapsed_seconds``,
+    ``images_per_second``, ``bytes_per_second``, ``eta_seconds`` (``None``
+    until a rate is known) and ``finished``.
+    """
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.success = 0
+        self.failed = 0
+        self.bytes_uploaded = 0
+        self.current = ""
+        self.finished = False
+        self.started = time.monotonic()
+        self._recent: deque = deque()  # (monotonic time, bytes)
+
+    def record(self, name: str, uploaded: bool, nbytes: int) -> None:
+        now = time.monotonic()
+        self.current = name
+        if uploaded:
+            self.success += 1
+            self.bytes_uploaded += nbytes
+        else:
+            self.failed += 1
+        self._recent.append((now, nbytes))
+        while self._recent and now - self._recent[0][0] > PROGRESS_WINDOW_SECONDS:
+            self._recent.popleft()
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        elapsed = now - self.started
+        done = self.success + self.failed
+        # Rate over the window, measured from its start (or the import start
+        # while fewer than PROGRESS_WINDOW_SECONDS have passed).
+        span = min(elapsed, PROGRESS_WINDOW_SECONDS)
+        images_per_s = len(self._recent) / span if span > 0 else 0.0
+        bytes_per_s = sum(b for _, b in self._recent) / span if span > 0 else 0.0
+        remaining = self.total - done
+        eta = remaining / images_per_s if images_per_s > 0 else None
+        return {
+            "images_total": self.total,
+            "images_done": done,
+            "success": self.success,
+            "failed": self.failed,
+            "bytes_uploaded": self.bytes_uploaded,
+            "current": self.current,
+            "elapsed_seconds": round(elapsed, 3),
+            "images_per_second": round(images_per_s, 3),
+            "bytes_per_second": round(bytes_per_s, 1),
+            "eta_seconds": 0.0 if remaining == 0 else (round(eta, 1) if eta is not None else None),
+            "finished": self.finished,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Presigned upload URLs
+# ---------------------------------------------------------------------------
+
+# Number of upcoming images whose upload URLs are requested ahead of the
+# encoder during a bulk import, so the ``put_file`` round trip overlaps with
+# decoding instead of preceding every PUT. 0 disables prefetching.
+UPLOAD_URL_LOOKAHEAD = 16
+# Lifetime of a presigned URL from ``put_file`` (Hypha's default expiry) and
+# how long before expiry a prefetched URL is considered stale and re-fetched.
+UPLOAD_URL_TTL_SECONDS = 3600.0
+UPLOAD_URL_REFRESH_MARGIN_SECONDS = 300.0
+
+
+class UploadUrlPool:
+    """Presigned upload URLs for one artifact, requested before they are needed.
+
+    :meth:`prefetch` starts ``put_file`` calls in the background. :meth:`get`
+    hands each URL out once, waiting for a pending request if needed, and
+    falls back to a direct call for paths that were never prefetched, whose
+    prefetch failed, or whose URL is within the refresh margin of expiry.
+    :meth:`close` removes the paths staged for URLs that were never handed
+    out.
+    """
+
+    def __init__(
+        self,
+        artifact_manager,
+        artifact_id: str,
+        ttl: float = UPLOAD_URL_TTL_SECONDS,
+        refresh_margin: float = UPLOAD_URL_REFRESH_MARGIN_SECONDS,
+    ) -> None:
+        self.artifact_manager = artifact_manager
+        self.artifact_id = artifact_id
+        self.ttl = ttl
+        self.refresh_margin = refresh_margin
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    async def _fetch(self, file_path: str) -> Tuple[str, float]:
+        # Timestamp before the call, so the age estimate errs towards stale.
+        requested = time.monotonic()
+        url = await self.artifact_manager.put_file(self.artifact_id, file_path=file_path)
+        return url, requested
+
+    def prefetch(self, file_paths: Sequence[str]) -> None:
+        for file_path in file_paths:
+            if file_path not in self._pending:
+                self._pending[file_path] = asyncio.ensure_future(self._fetch(file_path))
+
+    async def get(self, file_path: str) -> str:
+        future = self._pending.pop(file_path, None)
+        if future is not None:
+            try:
+                url, requested = await future
+                if time.monotonic() - requested < self.ttl - self.refresh_margin:
+                    return url
+                console.log(f"Upload URL for {file_path} is near expiry; refreshing")
+            except Exception as exc:
+                console.warn(f"Prefetching upload URL for {file_path} failed: {exc}")
+        url, _ = await self._fetch(file_path)
+        return url
+
+    async def close(self) -> None:
+        """Discard the URLs that were never handed out.
+
+        ``put_file`` stages its path in the artifact, so the paths of unused
+        URLs (e.g. of images that failed to decode, or of an import that was
+        cancelled) are removed again. Outstanding prefetches are awaited
+        rather than cancelled, since a request already sent may stage its
+        path anyway; failed ones are thereby retrieved and ignored.
+        """
+        pending, self._pending = self._pending, {}
+        results = await asyncio.gather(*pending.values(), return_exceptions=True)
+        staged = [
+            file_path
+            for file_path, result in zip(pending, results)
+            if not isinstance(result, BaseException)
+        ]
+        removed = await asyncio.gather(
+            *(
+                self.artifact_manager.remove_file(self.artifact_id, file_path=file_path)
+                for file_path in staged
+            ),
+            return_exceptions=True,
+        )
+        for file_path, result in zip(staged, removed):
+            if isinstance(result, BaseException):
+                console.warn(f"Removing unused upload path {file_path} failed: {result}")
 
 
 # ---------------------------------------------------------------------------
@@ -216,6 +1299,33 @@ class ImageImportSession:
         ``None`` for cloud-only sessions.
     server_url:
         Hypha server base URL.
+    encoding_profile:
+        :class:`EncodingProfile` used for every uploaded image. Recorded
+        under ``image_encoding`` in the artifact manifest.
+    recursive, include, exclude:
+        Listing options passed to :func:`list_image_files`. Files found in
+        sub-directories keep their relative path under ``images/``.
+    write_stats:
+        Upload a ``image_stats/{stem}.json`` sidecar (see
+        :func:`read_image_with_stats`) next to every image.
+    max_image_size:
+        If set, cap the longer side of every uploaded image at this many
+        pixels (see :func:`read_image`). For pyramidal sources this also
+        picks the pyramid level.
+    plane, pyramid_level:
+        Plane (``{"t": 0, "z": 12, "c": 1}``, missing axes default to 0) and
+        explicit pyramid level imported from TIFF/OME-TIFF/OME-Zarr sources
+        (see :func:`read_plane`).
+    tile_size:
+        If set, a TIFF/OME-TIFF/OME-Zarr plane larger than this is uploaded
+        as ``{stem}_r{row}_c{col}`` tiles of at most this size, each decoded
+        on its own and stretched with shared contrast bounds.
+    concurrency:
+        Number of images :meth:`upload_all_images` keeps in flight.
+    executor:
+        Optional :class:`concurrent.futures.Executor` (e.g. a process pool)
+        that runs :func:`prepare_image`; ``None`` decodes inline, as in the
+        browser kernel.
     """
 
     def __init__(
@@ -228,6 +1338,18 @@ class ImageImportSession:
         server_url: str,
         user_id: str = "",
         user_email: str = "",
+        encoding_profile: EncodingProfile = DEFAULT_ENCODING_PROFILE,
+        recursive: bool = False,
+        include: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        write_stats: bool = True,
+        max_image_size: Optional[int] = None,
+        plane: Optional[dict] = None,
+        pyramid_level: Optional[int] = None,
+        tile_size: Optional[int] = None,
+        concurrency: int = 1,
+        executor=None,
+        url_lookahead: int = UPLOAD_URL_LOOKAHEAD,
     ) -> None:
         self.artifact_manager = artifact_manager
         # artifact_alias is the short part (no workspace prefix)
@@ -239,7 +1361,23 @@ class ImageImportSession:
         self.server_url = server_url
         self.user_id = user_id
         self.user_email = user_email
+        self.encoding_profile = EncodingProfile(encoding_profile)
+        self.recursive = recursive
+        self.include = list(include or [])
+        self.exclude = list(exclude or [])
+        self.write_stats = write_stats
+        self.max_image_size = max_image_size
+        self.plane = dict(plane or {})
+        self.pyramid_level = pyramid_level
+        self.tile_size = tile_size
+        self.concurrency = max(1, int(concurrency))
+        self.executor = executor
+        self.url_lookahead = max(0, int(url_lookahead))
+        self._url_pool: Optional[UploadUrlPool] = None  # set during bulk imports
         self._artifact_ready = False  # True once artifact has been verified/created
+        self._progress: Optional[ImportProgress] = None  # last/current bulk import
+        self._last_progress_emit = 0.0
+        self._progress_callback_failed = False
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -253,11 +1391,34 @@ class ImageImportSession:
             and self.images_path.is_dir()
         )
 
+    @property
+    def _image_encoding(self) -> dict:
+        """Manifest entry telling downstream readers how ``images/`` is encoded."""
+        _, ext, media_type, options = _ENCODERS[self.encoding_profile]
+        return {
+            "profile": self.encoding_profile.value,
+            "extension": ext,
+            "media_type": media_type,
+            "lossless": True,
+            "options": dict(options),
+        }
+
+    def _list_files(self) -> Tuple[List[Path], List[Path]]:
+        return list_image_files(
+            self.images_path,
+            recursive=self.recursive,
+            include=self.include,
+            exclude=self.exclude,
+        )
+
     async def _ensure_artifact_exists(self) -> None:
         """Create or resume the artifact in ``bioimage-io/`` workspace.
 
         Called explicitly from :meth:`create_dataset`. Subsequent calls are
-        no-ops once the artifact is confirmed to exist.
+        no-ops once the artifact is confirmed to exist. Raises
+        ``ValueError`` if the artifact cannot be created, or if it is
+        resumed with an encoding profile other than the one its
+        ``image_encoding`` records.
         """
         if self._artifact_ready:
             return
@@ -266,21 +1427,38 @@ class ImageImportSession:
             artifact = await self.artifact_manager.read(
                 artifact_id=self.artifact_id, stage=True
             )
+        except Exception:
+            artifact = None
+
+        if artifact is not None:
             console.log(f"_ensure_artifact_exists: resuming {self.artifact_id}")
-            # Put into edit/stage mode so we can write new files
+            # ``image_encoding`` describes every file in ``images/``, so a
+            # dataset is only extended with images of the same profile.
+            manifest = dict(getattr(artifact, "manifest", None) or {})
+            stored = (manifest.get("image_encoding") or {}).get("profile")
+            if stored and stored != self.encoding_profile.value:
+                raise ValueError(
+                    f"Artifact {self.artifact_id!r} holds images encoded with "
+                    f"profile {stored!r}; resume it with that encoding profile "
+                    f"instead of {self.encoding_profile.value!r}"
+                )
+            # Put into edit/stage mode so we can write new files, and record
+            # the encoding of datasets created before it was stored.
+            manifest["image_encoding"] = self._image_encoding
             try:
                 await self.artifact_manager.edit(
-                    artifact_id=artifact.id, stage=True
+                    artifact_id=artifact.id, manifest=manifest, stage=True
                 )
             except Exception as exc:
                 console.warn(f"Could not put artifact into stage mode: {exc}")
-        except Exception:
+        else:
             console.log(f"_ensure_artifact_exists: creating {self.artifact_id}")
             try:
                 description = self.session_description
                 manifest: dict = {
                     "name": self.session_name,
                     "description": description,
+                    "image_encoding": self._image_encoding,
                 }
                 if self.user_id:
                     manifest["created_by"] = self.user_id
@@ -318,30 +1496,81 @@ class ImageImportSession:
 
         self._artifact_ready = True
 
+    @property
+    def _import_options(self) -> dict:
+        """Options passed to :func:`prepare_image` (kept picklable)."""
+        return {
+            "encoding_profile": self.encoding_profile.value,
+            "write_stats": self.write_stats,
+            "max_image_size": self.max_image_size,
+            "plane": self.plane,
+            "pyramid_level": self.pyramid_level,
+            "tile_size": self.tile_size,
+        }
+
+    def _upload_paths(self, rel: PurePosixPath) -> List[str]:
+        """Artifact paths written for local file *rel* when it is not tiled."""
+        stem = rel.with_suffix("").as_posix()
+        paths = [f"images/{stem}{_ENCODERS[self.encoding_profile][1]}"]
+        if self.write_stats:
+            paths.append(f"{STATS_DIR}/{stem}.json")
+        return paths
+
+    async def _upload_url(self, file_path: str) -> str:
+        if self._url_pool is not None:
+            return await self._url_pool.get(file_path)
+        return await self.artifact_manager.put_file(self.artifact_id, file_path=file_path)
+
     async def _upload_image(self, info: dict) -> bool:
         """Upload one local image to ``images/`` in the artifact.
 
-        Converts the source file to PNG before uploading.
-        Returns ``True`` on success, ``False`` on failure.
+        Decoding and encoding go through :func:`prepare_image`, on
+        ``executor`` if one is set. Large chunked sources are split into
+        tiles when ``tile_size`` is set; their names are stored in
+        ``info["tiles"]``. Returns ``True`` on success, ``False`` on failure.
         """
         local_path: Optional[Path] = info["local_path"]
         if local_path is None:
             return True  # already remote, nothing to do
+        info["bytes"] = 0
         try:
-            arr = read_image(local_path)
-            pil = Image.fromarray(arr, mode="RGB")
-            buf = io.BytesIO()
-            pil.save(buf, format="PNG")
-            upload_url = await self.artifact_manager.put_file(
-                self.artifact_id,
-                file_path=f"images/{info['name']}",
-            )
-            await _pyfetch(upload_url, method="PUT", body=buf.getvalue())
-            console.log(f"Uploaded {info['name']} to images/")
-            return True
+            if self.executor is None:
+                prepared = prepare_image(local_path, info["name"], self._import_options)
+            else:
+                prepared = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, prepare_image, local_path, info["name"], self._import_options
+                )
+            if prepared[0][0] != info["name"]:
+                info["tiles"] = [name for name, _, _ in prepared]
+            for name, data, stats in prepared:
+                await self._put_image(name, data, stats)
+                info["bytes"] += len(data)
         except Exception as exc:
             console.error(f"Failed to upload {info.get('name')}: {exc}")
             return False
+        return True
+
+    async def _put_image(self, name: str, data: bytes, stats: Optional[dict]) -> None:
+        """Upload one encoded image to ``images/{name}``.
+
+        With ``write_stats`` the stats sidecar is uploaded after the image;
+        a failed sidecar upload is logged but does not fail the image.
+        """
+        upload_url = await self._upload_url(f"images/{name}")
+        await _pyfetch(upload_url, method="PUT", body=data)
+        console.log(f"Uploaded {name} to images/")
+        if stats is not None:
+            await self._upload_stats(name, stats)
+
+    async def _upload_stats(self, image_name: str, stats: dict) -> None:
+        """Upload the stats sidecar for ``images/{image_name}``."""
+        stem = PurePosixPath(image_name).with_suffix("").as_posix()
+        body = json.dumps({"image": f"images/{image_name}", **stats}).encode()
+        try:
+            upload_url = await self._upload_url(f"{STATS_DIR}/{stem}.json")
+            await _pyfetch(upload_url, method="PUT", body=body)
+        except Exception as exc:
+            console.warn(f"Failed to upload stats for {image_name}: {exc}")
 
     # ------------------------------------------------------------------
     # Public service API
@@ -352,36 +1581,120 @@ class ImageImportSession:
         await self._ensure_artifact_exists()
         return {"artifact_id": self.artifact_id}
 
-    async def list_local_images(self, context=None) -> List[dict]:
-        """List stems and formats of supported images in the mounted folder."""
+    async def list_local_images(
+        self, with_metadata: bool = False, context=None
+    ) -> List[dict]:
+        """List stems and formats of supported images in the mounted folder.
+
+        For nested files the stem is the relative POSIX path without
+        extension (``"plate1/a1"``). With *with_metadata*, each entry also
+        carries the header fields of :func:`read_image_metadata` (or an
+        ``error`` string if the header could not be read), so the import can
+        be planned before any pixels are decoded.
+        """
         if not self._use_local:
             return []
-        supported, unsupported = list_image_files(self.images_path)
+        supported, unsupported = self._list_files()
         for uf in unsupported:
-            console.warn(f"Skipping unsupported file type in local folder: {uf.name}")
-        return [
-            {"stem": p.stem, "format": p.suffix.lower().lstrip(".")}
-            for p in supported
-        ]
+            console.warn(f"Skipping unsupported file type in local folder: {uf.as_posix()}")
+        entries = []
+        for p in supported:
+            entry = {"stem": p.with_suffix("").as_posix(), "format": p.suffix.lower().lstrip(".")}
+            if with_metadata:
+                try:
+                    entry.update(read_image_metadata(self.images_path / p))
+                except Exception as exc:
+                    entry["error"] = str(exc)
+            entries.append(entry)
+        return entries
 
     async def upload_image(self, name: str, context=None) -> dict:
-        """Read one local file by name, convert to PNG, upload to ``images/``."""
-        stem = Path(name).stem
+        """Read one local file by name, encode it, upload to ``images/``.
+
+        Returns ``{stem, name, uploaded, bytes, tiles}`` where *name* is the
+        uploaded file name, whose extension follows the session's encoding
+        profile, and *tiles* lists the tile names if the image was tiled.
+        *name* may be a relative POSIX path into a sub-directory; it is
+        mirrored under ``images/``.
+        """
+        rel = PurePosixPath(name)
+        stem = rel.with_suffix("").as_posix()
+        out_name = f"{stem}{_ENCODERS[self.encoding_profile][1]}"
         if not self.images_path:
             console.warn("upload_image: no local folder mounted")
-            return {"stem": stem, "uploaded": False}
+            return {"stem": stem, "name": out_name, "uploaded": False}
+        if rel.is_absolute() or ".." in rel.parts:
+            console.warn(f"upload_image: refusing path outside the mounted folder: {name!r}")
+            return {"stem": stem, "name": out_name, "uploaded": False}
 
         local_path = self.images_path / name
-        info = {"name": f"{stem}.png", "local_path": local_path, "source": "local"}
+        info = {"name": out_name, "local_path": local_path, "source": "local"}
         await self._ensure_artifact_exists()
         uploaded = await self._upload_image(info)
-        return {"stem": stem, "uploaded": uploaded}
+        return {
+            "stem": stem,
+            "name": out_name,
+            "uploaded": uploaded,
+            "bytes": info.get("bytes", 0),
+            "tiles": info.get("tiles", []),
+        }
+
+    async def benchmark_encoding(self, limit: int = 5, context=None) -> List[dict]:
+        """Benchmark all encoding profiles on the first *limit* local images.
+
+        See :func:`benchmark_encoding_profiles` for the result format.
+        """
+        if not self._use_local:
+            return []
+        supported, _ = self._list_files()
+        return benchmark_encoding_profiles(
+            [self.images_path / p for p in supported[: max(0, int(limit))]]
+        )
+
+    async def _report_progress(
+        self, on_progress: Optional[Callable], force: bool = False
+    ) -> None:
+        """Send a progress snapshot to *on_progress*, rate-limited unless *force*.
+
+        The callback may be a plain or async function (Hypha passes remote
+        callbacks as awaitables). A failing callback is logged and dropped
+        for the rest of the import rather than aborting it.
+        """
+        if on_progress is None or self._progress is None or self._progress_callback_failed:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_progress_emit < PROGRESS_MIN_INTERVAL_SECONDS:
+            return
+        self._last_progress_emit = now
+        try:
+            result = on_progress(self._progress.snapshot())
+            if inspect.isawaitable(result):
+                await result
+        except Exception as exc:
+            console.warn(f"upload_all_images: progress callback failed, disabling it: {exc}")
+            self._progress_callback_failed = True
 
-    async def upload_all_images(self, context=None) -> dict:
+    async def get_import_progress(self, context=None) -> dict:
+        """Return the latest progress snapshot of :meth:`upload_all_images`.
+
+        Polling alternative to the ``on_progress`` callback; ``{}`` before
+        the first bulk import.
+        """
+        return self._progress.snapshot() if self._progress else {}
+
+    async def upload_all_images(
+        self, on_progress: Optional[Callable] = None, context=None
+    ) -> dict:
         """Upload every supported image from the local folder to ``images/``.
 
-        Thin convenience loop over :meth:`upload_image`. Returns
-        ``{total, success, failed, errors}``.
+        Runs :meth:`upload_image` over the listing with ``concurrency``
+        images in flight. Upload URLs for the next ``url_lookahead`` images
+        are requested ahead of time through an :class:`UploadUrlPool`
+        (not when tiling, where output names are only known after
+        decoding). If *on_progress*
+        is given it is called with an :class:`ImportProgress` snapshot after
+        each image (at most every ``PROGRESS_MIN_INTERVAL_SECONDS``) and once
+        at the end. Returns ``{total, success, failed, errors}``.
         """
         if not self._use_local:
             reason = (
@@ -400,23 +1713,51 @@ class ImageImportSession:
 
         await self._ensure_artifact_exists()
 
-        supported, unsupported = list_image_files(self.images_path)
+        supported, unsupported = self._list_files()
         errors: List[str] = [
-            f"Skipping unsupported file: {f.name}" for f in unsupported
+            f"Skipping unsupported file: {f.as_posix()}" for f in unsupported
         ]
 
         total = len(supported)
-        success = 0
-        failed = 0
-
-        for lf in supported:
-            result = await self.upload_image(lf.name)
-            if result["uploaded"]:
-                success += 1
-            else:
-                failed += 1
-                errors.append(f"Failed to upload {lf.name}")
+        progress = self._progress = ImportProgress(total)
+        self._last_progress_emit = 0.0
+        self._progress_callback_failed = False
+        await self._report_progress(on_progress, force=True)
+
+        pending = iter(enumerate(supported))
+        lookahead = 0 if self.tile_size else self.url_lookahead
+        prefetched = 0  # files [0, prefetched) have had their URLs requested
+        if lookahead:
+            self._url_pool = UploadUrlPool(self.artifact_manager, self.artifact_id)
+
+        async def worker() -> None:
+            nonlocal prefetched
+            # Workers share one iterator, so each file is taken exactly once.
+            for index, lf in pending:
+                if self._url_pool is not None:
+                    # Keep the window at least one batch ahead of every worker.
+                    end = min(total, index + lookahead + self.concurrency)
+                    for ahead in supported[prefetched:end]:
+                        paths = self._upload_paths(PurePosixPath(ahead.as_posix()))
+                        self._url_pool.prefetch(paths)
+                    prefetched = max(prefetched, end)
+                result = await self.upload_image(lf.as_posix())
+                progress.record(lf.as_posix(), result["uploaded"], result["bytes"])
+                if not result["uploaded"]:
+                    errors.append(f"Failed to upload {lf.as_posix()}")
+                await self._report_progress(on_progress)
 
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(self.concurrency, total) or 1)))
+        finally:
+            if self._url_pool is not None:
+                url_pool, self._url_pool = self._url_pool, None
+                await url_pool.close()
+
+        progress.finished = True
+        await self._report_progress(on_progress, force=True)
+        success = progress.success
+        failed = progress.failed
         console.log(f"upload_all_images: {success}/{total} succeeded, {failed} failed")
         return {"total": total, "success": success, "failed": failed, "errors": errors}
 
@@ -437,6 +1778,14 @@ async def register_service(
     service_id: str = None,
     user_id: str = "",
     user_email: str = "",
+    encoding_profile: str = DEFAULT_ENCODING_PROFILE.value,
+    recursive: bool = False,
+    include: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+    max_image_size: Optional[int] = None,
+    plane: Optional[dict] = None,
+    pyramid_level: Optional[int] = None,
+    tile_size: Optional[int] = None,
 ) -> dict:
     """Connect to Hypha and register the image-import service.
 
@@ -452,6 +1801,15 @@ async def register_service(
     images_path:
         String path to the locally mounted folder (``"/mnt"``), or
         ``"None"`` / empty for cloud-only sessions.
+    encoding_profile:
+        One of the :class:`EncodingProfile` values (default ``"png-fast"``).
+    recursive, include, exclude:
+        Folder listing options, see :func:`list_image_files`.
+    max_image_size:
+        Optional cap on the longer side of uploaded images, in pixels.
+    plane, pyramid_level, tile_size:
+        Plane/level selection and tiling of TIFF, OME-TIFF and OME-Zarr
+        sources, see :class:`ImageImportSession`.
 
     Returns
     -------
@@ -466,6 +1824,14 @@ async def register_service(
     if connect_to_server is None:
         raise RuntimeError("hypha_rpc is not available")
 
+    try:
+        profile = EncodingProfile(encoding_profile)
+    except ValueError as exc:
+        raise ValueError(
+            f"Unknown encoding_profile {encoding_profile!r}; expected one of "
+            f"{[p.value for p in EncodingProfile]}"
+        ) from exc
+
     # ── Connect ──────────────────────────────────────────────────────────────
     connect_cfg: dict = {"server_url": server_url, "token": token}
     if client_id:
@@ -514,11 +1880,13 @@ async def register_service(
             f"exists={p.exists()}, is_dir={p.is_dir() if p.exists() else 'N/A'}"
         )
         if p.exists() and p.is_dir():
-            supported, unsupported = list_image_files(p)
+            supported, unsupported = list_image_files(
+                p, recursive=recursive, include=include, exclude=exclude
+            )
             if unsupported:
                 console.warn(
                     f"{len(unsupported)} unsupported file(s) in {p} will be skipped: "
-                    f"{[f.name for f in unsupported[:5]]}"
+                    f"{[f.as_posix() for f in unsupported[:5]]}"
                 )
             console.log(f"Local folder {p}: {len(supported)} supported image(s)")
             resolved_path = p
@@ -535,6 +1903,14 @@ async def register_service(
         server_url=server_url,
         user_id=user_id or "",
         user_email=user_email or "",
+        encoding_profile=profile,
+        recursive=recursive,
+        include=include,
+        exclude=exclude,
+        max_image_size=max_image_size,
+        plane=plane,
+        pyramid_level=pyramid_level,
+        tile_size=tile_size,
     )
 
     console.log(
@@ -559,6 +1935,8 @@ async def register_service(
                 "list_local_images": session.list_local_images,
                 "upload_image": session.upload_image,
                 "upload_all_images": session.upload_all_images,
+                "get_import_progress": session.get_import_progress,
+                "benchmark_encoding": session.benchmark_encoding,
             }
         )
     except Exception as exc:
@@ -576,3 +1954,176 @@ async def register_service(
         "workspace": user_workspace,
         "client_id": _hypha_client.config.get("client_id", ""),
     }
+
+
+# ---------------------------------------------------------------------------
+# Headless bulk import (CPython)
+# ---------------------------------------------------------------------------
+
+
+def _new_artifact_alias() -> str:
+    """``annotation-{base36 ms}-{4 random chars}``, like the frontend's aliases."""
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    ms, stamp = int(time.time() * 1000), ""
+    while ms:
+        ms, r = divmod(ms, 36)
+        stamp = digits[r] + stamp
+    suffix = "".join(digits[b % 36] for b in os.urandom(4))
+    return f"annotation-{stamp}-{suffix}"
+
+
+async def bulk_import(
+    folder: Path,
+    server_url: str,
+    token: str,
+    artifact_alias: Optional[str] = None,
+    name: Optional[str] = None,
+    description: str = "",
+    workers: Optional[int] = None,
+    concurrency: int = 8,
+    on_progress: Optional[Callable] = None,
+    **session_options,
+) -> dict:
+    """Import *folder* into a dataset from CPython, without a browser tab.
+
+    Creates a new dataset, or resumes *artifact_alias* if it already exists.
+    Decoding and encoding run in a process pool of *workers* processes
+    (``0`` decodes inline), while *concurrency* uploads share the pooled
+    HTTP client. Extra keyword arguments are passed to
+    :class:`ImageImportSession` (``encoding_profile``, ``recursive``,
+    ``tile_size`` and so on). Returns the :meth:`upload_all_images` result
+    with ``artifact_id`` added.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if connect_to_server is None:
+        raise RuntimeError("hypha_rpc is not available")
+    if not folder.is_dir():
+        raise ValueError(f"Not a directory: {folder}")
+
+    client = await connect_to_server({"server_url": server_url, "token": token})
+    executor = ProcessPoolExecutor(max_workers=workers) if workers != 0 else None
+    try:
+        artifact_manager = await client.get_service("public/artifact-manager")
+        await artifact_manager.read(artifact_id=COLLECTION_ID)
+        user = client.config.get("user") or {}
+        alias = artifact_alias or _new_artifact_alias()
+        session = ImageImportSession(
+            artifact_manager=artifact_manager,
+            artifact_alias=alias,
+            session_name=name or alias.split("/")[-1],
+            session_description=description,
+            images_path=folder,
+            server_url=server_url,
+            user_id=user.get("id", ""),
+            user_email=user.get("email", ""),
+            concurrency=concurrency,
+            executor=executor,
+            **session_options,
+        )
+        await session.create_dataset()
+        result = await session.upload_all_images(on_progress=on_progress)
+        result["artifact_id"] = session.artifact_id
+        return result
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        await _close_http_client()
+        await client.disconnect()
+
+
+def _print_progress(event: dict) -> None:
+    eta = event["eta_seconds"]
+    print(
+        f"[import] {event['images_done']}/{event['images_total']} "
+        f"({event['failed']} failed)  "
+        f"{event['images_per_second']:.1f} img/s  "
+        f"{event['bytes_per_second'] / 1e6:.1f} MB/s  "
+        f"ETA {'?' if eta is None else f'{eta:.0f}s'}",
+        flush=True,
+    )
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Bulk-import a local image folder into a BioImage.IO Colab dataset"
+    )
+    parser.add_argument("folder", type=Path, help="Folder with images to import")
+    parser.add_argument("--server-url", default="https://hypha.aicell.io")
+    parser.add_argument(
+        "--alias",
+        help="Existing dataset alias to add images to (default: create a new dataset)",
+    )
+    parser.add_argument("--name", help="Dataset name for a new dataset (default: its alias)")
+    parser.add_argument("--description", default="", help="Dataset description")
+    parser.add_argument("--recursive", action="store_true", help="Include sub-folders")
+    parser.add_argument("--include", nargs="+", help="Glob patterns of files to import")
+    parser.add_argument("--exclude", nargs="+", help="Glob patterns of files to skip")
+    parser.add_argument(
+        "--encoding-profile",
+        choices=[p.value for p in EncodingProfile],
+        default=DEFAULT_ENCODING_PROFILE.value,
+    )
+    parser.add_argument("--max-size", type=int, help="Cap on the longer image side, in pixels")
+    parser.add_argument("--tile-size", type=int, help="Split larger TIFF/Zarr planes into tiles")
+    parser.add_argument(
+        "--plane",
+        nargs="+",
+        default=[],
+        metavar="AXIS=INDEX",
+        help="Plane to import from multi-dimensional sources, e.g. z=10 c=1",
+    )
+    parser.add_argument("--level", type=int, help="Pyramid level to import")
+    parser.add_argument("--no-stats", action="store_true", help="Do not write stats sidecars")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Decode/encode processes (default: CPU count, 0 decodes inline)",
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="Uploads in flight")
+    args = parser.parse_args()
+
+    try:
+        plane = {k: int(v) for k, v in (item.split("=", 1) for item in args.plane)}
+    except ValueError:
+        parser.error("--plane expects AXIS=INDEX pairs, e.g. z=10")
+
+    async def run() -> dict:
+        token = os.environ.get("HYPHA_TOKEN")
+        if not token:
+            from hypha_rpc import login  # type: ignore
+
+            token = await login({"server_url": args.server_url})
+        return await bulk_import(
+            folder=args.folder,
+            server_url=args.server_url,
+            token=token,
+            artifact_alias=args.alias,
+            name=args.name,
+            description=args.description,
+            workers=args.workers,
+            concurrency=args.concurrency,
+            on_progress=_print_progress,
+            encoding_profile=args.encoding_profile,
+            recursive=args.recursive,
+            include=args.include,
+            exclude=args.exclude,
+            max_image_size=args.max_size,
+            plane=plane,
+            pyramid_level=args.level,
+            tile_size=args.tile_size,
+            write_stats=not args.no_stats,
+        )
+
+    result = asyncio.run(run())
+    print(json.dumps(result, indent=2))
+    if result["failed"]:
+        raise SystemExit(1)
+
+
+# The browser kernel also executes this file as ``__main__``; only run the
+# command-line importer under CPython.
+if __name__ == "__main__" and sys.platform != "emscripten":
+    main()
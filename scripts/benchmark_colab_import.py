@@ -0,0 +1,383 @@
+"""Offline throughput benchmark for the Colab image importer.
+
+Drives ``ImageImportSession.upload_all_images`` from ``public/colab_service.py``
+against an in-process stand-in for the Hypha artifact manager and a local
+HTTP PUT sink, so import throughput can be measured without a live server.
+
+The fake artifact manager implements the calls the importer makes (``read``,
+``edit``, ``create``, ``put_file``, ``remove_file``) with a configurable
+per-RPC latency. The sink runs on its own thread and event loop, accepts
+keep-alive PUTs, and applies a per-request latency plus a bandwidth limit,
+which is enough to emulate a remote S3 endpoint. Synthetic folders mix 8-bit JPEG/PNG, 16-bit
+TIFF and float32 TIFF images.
+
+Every combination of ``--concurrency``, ``--workers`` and
+``--encoding-profile`` is run once and reported as images/s, MB/s
+(uploaded bytes) and peak RSS of the main process during that run.
+
+Example:
+    python benchmark_colab_import.py --images 40 --size 2048 \\
+        --put-latency-ms 80 --bandwidth-mbps 200 --concurrency 1 4 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+import numpy as np
+from PIL import Image
+import tifffile
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "public"))
+import colab_service  # noqa: E402
+
+
+class FakeArtifactManager:
+    """In-process stand-in for the ``public/artifact-manager`` service.
+
+    Keeps artifacts in a dict and hands out upload URLs pointing at the local
+    PUT sink. Artifacts are returned as attribute-accessible objects, like the
+    ``ObjectProxy`` results of hypha_rpc. Every call sleeps ``rpc_latency`` seconds to model the Hypha
+    round trip, and is counted in ``calls``.
+    """
+
+    def __init__(self, sink_url: str, rpc_latency: float = 0.0) -> None:
+        self.sink_url = sink_url
+        self.rpc_latency = rpc_latency
+        self.artifacts: Dict[str, SimpleNamespace] = {}
+        self.calls: Dict[str, int] = {}
+
+    async def _rpc(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self.rpc_latency:
+            await asyncio.sleep(self.rpc_latency)
+
+    async def read(self, artifact_id: str, stage: bool = False, **_) -> SimpleNamespace:
+        await self._rpc("read")
+        if artifact_id not in self.artifacts:
+            raise KeyError(f"Artifact not found: {artifact_id}")
+        return self.artifacts[artifact_id]
+
+    async def create(
+        self, parent_id: str, alias: str, manifest: dict, type: str = "generic", **_
+    ) -> SimpleNamespace:
+        await self._rpc("create")
+        workspace = parent_id.split("/")[0]
+        artifact = SimpleNamespace(id=f"{workspace}/{alias}", manifest=manifest, type=type)
+        self.artifacts[artifact.id] = artifact
+        return artifact
+
+    async def edit(self, artifact_id: str, manifest: Optional[dict] = None, **_) -> None:
+        await self._rpc("edit")
+        if manifest is not None:
+            self.artifacts[artifact_id].manifest = manifest
+
+    async def put_file(self, artifact_id: str, file_path: str, **_) -> str:
+        await self._rpc("put_file")
+        return f"{self.sink_url}/{artifact_id}/{file_path}"
+
+    async def remove_file(self, artifact_id: str, file_path: str, **_) -> None:
+        await self._rpc("remove_file")
+
+
+class PutSink:
+    """Minimal HTTP/1.1 PUT endpoint with latency and bandwidth limits.
+
+    Runs its own event loop on a daemon thread, so CPU work in the importer
+    does not distort the simulated network. The bandwidth limit is shared by
+    all connections, like a single uplink.
+    """
+
+    def __init__(self, latency: float = 0.0, bandwidth: Optional[float] = None) -> None:
+        self.latency = latency
+        self.bandwidth = bandwidth  # bytes per second, None = unlimited
+        self.requests = 0
+        self.bytes_received = 0
+        self.url = ""
+        self._link_free_at = 0.0
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped: Optional[asyncio.Event] = None
+
+    def start(self) -> str:
+        self._thread.start()
+        self._ready.wait()
+        return self.url
+
+    def stop(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+            self._thread.join()
+
+    def _run(self) -> None:
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        self._ready.set()
+        async with server:
+            await self._stopped.wait()
+        # Drop keep-alive connections still parked in readline().
+        for task in asyncio.all_tasks() - {asyncio.current_task()}:
+            task.cancel()
+
+    async def _transfer_delay(self, size: int) -> float:
+        if not self.bandwidth:
+            return 0.0
+        # Serialise transfers over one simulated link.
+        now = time.monotonic()
+        start = max(now, self._link_free_at)
+        self._link_free_at = start + size / self.bandwidth
+        return self._link_free_at - now
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                size = int(headers.get("content-length", "0"))
+                if size:
+                    await reader.readexactly(size)
+                await asyncio.sleep(self.latency + await self._transfer_delay(size))
+                self.requests += 1
+                self.bytes_received += size
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, asyncio.CancelledError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def make_synthetic_folder(folder: Path, count: int, size: int, formats: List[str]) -> None:
+    """Write *count* noisy, blob-textured images cycling through *formats*.
+
+    ``jpg``/``png`` are 8-bit RGB/gray, ``tif16`` is 16-bit grayscale and
+    ``tif32`` float32 grayscale, roughly like fluorescence microscopy.
+    """
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[:size, :size].astype(np.float32) / size
+    for i in range(count):
+        fmt = formats[i % len(formats)]
+        base = np.sin(x * (6 + i % 5) * np.pi) * np.cos(y * (4 + i % 3) * np.pi)
+        img = (base + 1.0) * 0.5 + rng.normal(0, 0.05, (size, size)).astype(np.float32)
+        img = np.clip(img, 0, 1)
+        name = folder / f"img_{i:04d}"
+        if fmt == "jpg":
+            rgb = (np.stack([img, img[::-1], img[:, ::-1]], axis=-1) * 255).astype(np.uint8)
+            Image.fromarray(rgb).save(name.with_suffix(".jpg"), quality=90)
+        elif fmt == "png":
+            Image.fromarray((img * 255).astype(np.uint8)).save(name.with_suffix(".png"))
+        elif fmt == "tif16":
+            tifffile.imwrite(name.with_suffix(".tif"), (img * 4095).astype(np.uint16))
+        elif fmt == "tif32":
+            tifffile.imwrite(name.with_suffix(".tiff"), img.astype(np.float32))
+        else:
+            raise ValueError(f"Unknown synthetic format: {fmt}")
+
+
+class RssSampler:
+    """Samples the main process RSS on a thread; ``peak`` is in bytes.
+
+    Uses ``/proc/self/statm`` where available and falls back to
+    ``ru_maxrss`` (which is a lifetime maximum, not a per-run one).
+    """
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def current() -> int:
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError):
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.current())
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.current())
+
+
+async def run_once(
+    folder: Path,
+    sink: PutSink,
+    rpc_latency: float,
+    concurrency: int,
+    workers: int,
+    encoding_profile: str,
+    url_lookahead: int,
+) -> dict:
+    """Import *folder* once and return throughput figures."""
+    artifact_manager = FakeArtifactManager(sink.url, rpc_latency=rpc_latency)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers else None
+    requests_before, bytes_before = sink.requests, sink.bytes_received
+    try:
+        session = colab_service.ImageImportSession(
+            artifact_manager=artifact_manager,
+            artifact_alias=f"annotation-bench-{concurrency}-{workers}-{encoding_profile}",
+            session_name="benchmark",
+            session_description="",
+            images_path=folder,
+            server_url="http://localhost",
+            encoding_profile=encoding_profile,
+            concurrency=concurrency,
+            executor=executor,
+            url_lookahead=url_lookahead,
+        )
+        await session.create_dataset()
+        with RssSampler() as rss:
+            start = time.perf_counter()
+            result = await session.upload_all_images()
+            elapsed = time.perf_counter() - start
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    uploaded = sink.bytes_received - bytes_before
+    return {
+        "concurrency": concurrency,
+        "workers": workers,
+        "encoding_profile": encoding_profile,
+        "images": result["success"],
+        "failed": result["failed"],
+        "seconds": round(elapsed, 3),
+        "images_per_second": round(result["success"] / elapsed, 2) if elapsed else 0.0,
+        "mb_per_second": round(uploaded / elapsed / 1e6, 2) if elapsed else 0.0,
+        "uploaded_mb": round(uploaded / 1e6, 2),
+        "put_requests": sink.requests - requests_before,
+        "rpc_calls": dict(artifact_manager.calls),
+        "peak_rss_mb": round(rss.peak / 1e6, 1),
+    }
+
+
+async def benchmark(args: argparse.Namespace, folder: Path) -> List[dict]:
+    sink = PutSink(
+        latency=args.put_latency_ms / 1000,
+        bandwidth=args.bandwidth_mbps * 1e6 / 8 if args.bandwidth_mbps else None,
+    )
+    sink.start()
+    results = []
+    try:
+        for profile in args.encoding_profile:
+            for workers in args.workers:
+                for concurrency in args.concurrency:
+                    row = await run_once(
+                        folder,
+                        sink,
+                        rpc_latency=args.rpc_latency_ms / 1000,
+                        concurrency=concurrency,
+                        workers=workers,
+                        encoding_profile=profile,
+                        url_lookahead=args.url_lookahead,
+                    )
+                    print(
+                        f"profile={profile:<14} workers={workers:<2} "
+                        f"concurrency={concurrency:<3} "
+                        f"{row['images_per_second']:7.2f} img/s "
+                        f"{row['mb_per_second']:7.2f} MB/s "
+                        f"peak RSS {row['peak_rss_mb']:7.1f} MB",
+                        flush=True,
+                    )
+                    results.append(row)
+    finally:
+        await colab_service._close_http_client()
+        sink.stop()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Colab image importer against a local artifact-manager stand-in"
+    )
+    parser.add_argument("--images", type=int, default=24, help="Number of synthetic images")
+    parser.add_argument("--size", type=int, default=1024, help="Synthetic image side length")
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        default=["jpg", "png", "tif16", "tif32"],
+        choices=["jpg", "png", "tif16", "tif32"],
+        help="Synthetic formats, cycled through",
+    )
+    parser.add_argument(
+        "--folder",
+        type=Path,
+        help="Use an existing image folder instead of generating one",
+    )
+    parser.add_argument("--rpc-latency-ms", type=float, default=0.0, help="Latency per artifact-manager call")
+    parser.add_argument("--put-latency-ms", type=float, default=0.0, help="Latency per PUT request")
+    parser.add_argument("--bandwidth-mbps", type=float, default=0.0, help="Uplink bandwidth in Mbit/s (0 = unlimited)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4], help="Uploads in flight")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0], help="Process-pool sizes (0 = inline)")
+    parser.add_argument(
+        "--encoding-profile",
+        nargs="+",
+        default=[colab_service.DEFAULT_ENCODING_PROFILE.value],
+        choices=[p.value for p in colab_service.EncodingProfile],
+    )
+    parser.add_argument(
+        "--url-lookahead",
+        type=int,
+        default=colab_service.UPLOAD_URL_LOOKAHEAD,
+        help="Upload URLs prefetched ahead of the encoder (0 = off)",
+    )
+    parser.add_argument("--json", type=Path, help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    # The importer logs every upload; keep the benchmark output readable.
+    colab_service.console.log = staticmethod(lambda *a: None)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = args.folder
+        if folder is None:
+            folder = Path(tmp)
+            print(f"Generating {args.images} synthetic {args.size}px images...", flush=True)
+            make_synthetic_folder(folder, args.images, args.size, args.formats)
+        results = asyncio.run(benchmark(args, folder))
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"Saved results to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,69 +1,1088 @@
 import argparse
 import asyncio
+import fnmatch
 import json
+import math
 import os
+import random
+import shutil
+import statistics
 import sys
 import time
 import traceback
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import httpx
 from hypha_rpc import connect_to_server, login
 from hypha_rpc.utils import ObjectProxy
 
+from model_runner_simulator import SIMULATOR_PREFIX, ModelRunnerSimulator
+from model_test_history import COMPLETED_STATUSES, TestHistory, error_signature
+
 
 # Fully-qualified id of the model-runner service to test against. Overridable
-# via --service-id so a run can target a specific worker/cluster.
+# via --service-id so a run can target a specific worker/cluster, or several
+# (ids or globs such as bioimage-io/bioengine-worker-*:model-runner) to spread
+# the tests over all of them. Ids starting with "simulate:" select an
+# in-process ModelRunnerSimulator instead (see model_runner_simulator.py).
 DEFAULT_SERVICE_ID = "bioimage-io/model-runner"
 
+# With several runners, each new test goes to the one reporting the lowest
+# get_load(); loads are re-polled at most every RUNNER_LOAD_REFRESH_SECONDS,
+# and a runner not answering within RUNNER_LOAD_TIMEOUT_SECONDS is skipped.
+RUNNER_LOAD_REFRESH_SECONDS = 2.0
+RUNNER_LOAD_TIMEOUT_SECONDS = 5.0
+
+# Circuit breaker: after CIRCUIT_BREAKER_THRESHOLD consecutive service-timeout
+# or service-error outcomes on a runner, no new tests are routed to it and it
+# is probed through get_load() with exponential backoff from
+# CIRCUIT_PROBE_INITIAL_SECONDS up to CIRCUIT_PROBE_MAX_SECONDS. Tests caught
+# by the outage are reported as "deferred" and re-tested once at the end of
+# the run; if no runner recovers within CIRCUIT_GIVE_UP_SECONDS, all models
+# still to test are deferred instead of each waiting out its timeout.
+SERVICE_FAILURE_STATUSES = ("service-timeout", "service-error")
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_PROBE_INITIAL_SECONDS = 10.0
+CIRCUIT_PROBE_MAX_SECONDS = 300.0
+CIRCUIT_PROBE_TIMEOUT_SECONDS = 30.0
+CIRCUIT_GIVE_UP_SECONDS = 1800.0
+
 # Testing is submitted through the async model-runner API: ``test()`` returns a
 # run id immediately and the report is retrieved by polling
 # ``get_test_status(test_run_id)`` until its ``result`` field is populated.
+# TEST_TIMEOUT_SECONDS is the timeout for models without enough history.
 TEST_TIMEOUT_SECONDS = 300
-TEST_POLL_INTERVAL_SECONDS = 3
+
+# Per-model timeouts (see load_timeouts): TEST_TIMEOUT_MARGIN x the p99 of a
+# model's recent completed-test durations, clamped to
+# [TEST_TIMEOUT_FLOOR_SECONDS, TEST_TIMEOUT_CEILING_SECONDS], once at least
+# TEST_TIMEOUT_MIN_SAMPLES durations are known. A model whose last test timed
+# out gets twice that test's duration (up to the ceiling), so slow models are
+# given more time on every run instead of timing out forever. Explicit
+# timeouts for known heavy models are read from DEFAULT_TIMEOUT_OVERRIDES.
+TEST_TIMEOUT_MARGIN = 3.0
+TEST_TIMEOUT_FLOOR_SECONDS = 60.0
+TEST_TIMEOUT_CEILING_SECONDS = 1800.0
+TEST_TIMEOUT_MIN_SAMPLES = 3
+# The timeout counts from when the run starts executing; time spent queued
+# on a busy runner does not count, up to TEST_QUEUE_TIMEOUT_SECONDS.
+TEST_QUEUE_TIMEOUT_SECONDS = 1800.0
+DEFAULT_TIMEOUT_OVERRIDES = Path(__file__).resolve().parent / "model_test_timeouts.json"
+
+# Polling starts fast so short tests are picked up promptly, then backs off
+# exponentially (with jitter, so concurrent runs do not poll in lockstep) for
+# long runs. While a run is queued, the interval is at least its queue
+# position times TEST_POLL_PER_QUEUE_POSITION_SECONDS; when it starts running
+# the interval drops back to TEST_POLL_INITIAL_SECONDS.
+TEST_POLL_INITIAL_SECONDS = 0.5
+TEST_POLL_MAX_SECONDS = 15.0
+TEST_POLL_BACKOFF = 1.5
+TEST_POLL_JITTER = 0.2
+TEST_POLL_PER_QUEUE_POSITION_SECONDS = 2.0
+
+# Incremental mode (--incremental) re-tests a model only when its artifact or
+# the deployed runner changed since its last published report, or when that
+# report was a service failure. On top of that, the unchanged models whose
+# stable hash falls into today's bucket are re-tested to catch drift, so every
+# model is re-tested at least every 1 / INCREMENTAL_DRIFT_FRACTION days.
+ARTIFACTS_URL = "https://hypha.aicell.io/bioimage-io/artifacts"
+# Page size for collection listings; testing starts after the first page.
+LISTING_PAGE_SIZE = 200
+RUNNER_ARTIFACT_ID = "bioimage-io/model-runner"
+INCREMENTAL_DRIFT_FRACTION = 0.05
+RETEST_STATUSES = {"service-timeout", "service-error", "deferred"}
+
+# Local SQLite store that every test outcome is appended to (see
+# model_test_history.py); overridable via --history-db.
+DEFAULT_HISTORY_DB = Path(__file__).resolve().parent.parent / "bioimageio_test_history.sqlite"
+
+# Machine-readable summary written by --analyze-reports into the reports
+# directory; it is not a model report and is skipped wherever reports are read.
+SUMMARY_FILENAME = "summary.json"
+# Number of slowest models listed in the summary.
+SLOWEST_MODELS_LISTED = 10
+
+# Orphan cleanup lists collections CLEANUP_PAGE_SIZE items at a time and keeps
+# CLEANUP_CONCURRENCY deletes in flight, retrying each failed delete with
+# exponential backoff starting at CLEANUP_RETRY_BASE_SECONDS.
+CLEANUP_PAGE_SIZE = 500
+CLEANUP_CONCURRENCY = 8
+CLEANUP_DELETE_RETRIES = 3
+CLEANUP_RETRY_BASE_SECONDS = 1.0
+
+# Duration assumed for models without history when balancing --shard, if no
+# other model has a recorded duration either.
+DEFAULT_MODEL_DURATION_SECONDS = 60.0
+
+# Upper bound on test runs kept in flight by --concurrency. The runner shares
+# its run queue between test() and infer(), and Ray Serve starts rejecting
+# requests (handle_request_with_rejection) when the backlog grows too large;
+# tests/queue-fill.py found ~10 outstanding jobs to be safe.
+MAX_TEST_CONCURRENCY = 8
+
+
+def _status_field(status, key: str):
+    """Field of a ``get_test_status`` payload, at the top level or under ``run``."""
+    if not isinstance(status, dict):
+        return None
+    value = status.get(key)
+    if value is None and isinstance(status.get("run"), dict):
+        value = status["run"].get(key)
+    return value
+
+
+def _queue_position(status) -> Optional[int]:
+    """Queue position from a ``get_test_status`` payload, if reported.
+
+    ``0`` means the run is executing.
+    """
+    position = _status_field(status, "queue_position")
+    return position if isinstance(position, int) else None
+
+
+def _timestamp(status, *keys: str) -> Optional[float]:
+    for key in keys:
+        value = _status_field(status, key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+    return None
+
+
+def _submitted_at(status) -> Optional[float]:
+    """Runner-reported submission time (epoch seconds), if any."""
+    return _timestamp(status, "submitted_at")
+
+
+def _started_at(status) -> Optional[float]:
+    """Runner-reported execution start time (epoch seconds), if any."""
+    return _timestamp(status, "started_at")
+
+
+def _completed_at(status) -> Optional[float]:
+    """Runner-reported completion time (epoch seconds), if any."""
+    return _timestamp(status, "completed_at", "finished_at")
+
+
+def _execution_start(stats: dict) -> Optional[float]:
+    """Harness-clock time the run started executing, if known.
+
+    The runner-reported queue wait is added to the harness submission time,
+    so the estimate is not affected by clock skew; otherwise the first poll
+    that saw the run executing is used.
+    """
+    runner_submitted = stats.get("runner_submitted_at")
+    runner_started = stats.get("started_at")
+    submitted = stats.get("submitted_at")
+    if None not in (runner_submitted, runner_started, submitted):
+        return submitted + max(0.0, runner_started - runner_submitted)
+    return stats.get("started_polled_at")
+
+
+def timing_breakdown(stats: dict) -> dict:
+    """Split a test's wall time into queue wait, execution and polling overhead.
+
+    Uses the timestamps :func:`run_test` stores in *stats*. On the harness
+    clock: ``submitted_at`` (``test()`` returned), ``started_polled_at``
+    (first poll that was neither queued nor already done) and
+    ``observed_at`` (poll that returned the result). On the runner clock, if
+    reported: ``runner_submitted_at``, ``started_at`` and ``completed_at``.
+
+    Every span is measured between two timestamps of the same clock, so
+    clock skew between harness and runner does not distort it: runner
+    timestamps are preferred and harness poll times are the fallback.
+    Polling overhead is the harness-observed total minus the runner-reported
+    total. Durations that cannot be derived are None. When a span falls back
+    to a poll time, queue wait is an upper bound and execution a lower
+    bound, each off by at most one poll interval.
+    """
+    submitted = stats.get("submitted_at")
+    polled_start = stats.get("started_polled_at")
+    observed = stats.get("observed_at")
+    runner_submitted = stats.get("runner_submitted_at")
+    runner_started = stats.get("started_at")
+    runner_completed = stats.get("completed_at")
+
+    def span(start, end):
+        return round(max(0.0, end - start), 3) if start is not None and end is not None else None
+
+    queue_wait = span(runner_submitted, runner_started)
+    if queue_wait is None:
+        queue_wait = span(submitted, polled_start)
+    execution = span(runner_started, runner_completed)
+    if execution is None:
+        execution = span(polled_start, observed)
+    harness_total = span(submitted, observed)
+    runner_total = span(runner_submitted, runner_completed)
+    overhead = None
+    if harness_total is not None and runner_total is not None:
+        overhead = round(max(0.0, harness_total - runner_total), 3)
+
+    return {
+        "submitted_at": submitted,
+        "started_at": runner_started if runner_started is not None else polled_start,
+        "completed_at": runner_completed,
+        "observed_at": observed,
+        "queue_wait_seconds": queue_wait,
+        "execution_seconds": execution,
+        "polling_overhead_seconds": overhead,
+    }
+
+
+def next_poll_interval(interval: float, queue_position: Optional[int]) -> Tuple[float, float]:
+    """Return ``(sleep, next_interval)`` for the adaptive polling schedule."""
+    if queue_position is not None and queue_position > 0:
+        interval = max(interval, queue_position * TEST_POLL_PER_QUEUE_POSITION_SECONDS)
+    interval = min(interval, TEST_POLL_MAX_SECONDS)
+    sleep = interval * random.uniform(1 - TEST_POLL_JITTER, 1 + TEST_POLL_JITTER)
+    return sleep, min(interval * TEST_POLL_BACKOFF, TEST_POLL_MAX_SECONDS)
 
 
 async def run_test(
-    runner: ObjectProxy, model_id: str, skip_cache: bool
+    runner: ObjectProxy,
+    model_id: str,
+    skip_cache: bool,
+    stats: Optional[dict] = None,
+    run_id: Optional[str] = None,
+    on_submit: Optional[Callable[[str], None]] = None,
+    timeout: float = TEST_TIMEOUT_SECONDS,
 ) -> dict:
     """Submit a model test and wait for the report via the async runner API.
 
     ``test()`` returns a run id string on the v1.15+ async API; the report is
     then retrieved by polling ``get_test_status(test_run_id)`` until its
-    ``result`` field is populated. A ``result`` carrying an ``error`` key is
+    ``result`` field is populated, on the adaptive schedule described at
+    ``TEST_POLL_INITIAL_SECONDS``. A ``result`` carrying an ``error`` key is
     surfaced as a ``RuntimeError``. The runner publishes the report to the
     ``bioimage-io/test-reports`` collection itself. Raises
     ``asyncio.TimeoutError`` when the run does not complete within
-    ``TEST_TIMEOUT_SECONDS``.
-    """
-    run_id = await runner.test(
-        model_id=model_id, stage=False, cache="skip" if skip_cache else "check"
-    )
+    *timeout* seconds (see :func:`load_timeouts`) of starting to execute;
+    while the runner reports the run as queued, the deadline is pushed back
+    (by at most ``TEST_QUEUE_TIMEOUT_SECONDS``), so fast models queued
+    behind others on a busy runner do not time out before they run.
 
-    # Legacy synchronous runners returned the report dict directly instead of a
-    # run id; accept that so the script keeps working during a rollout.
-    if not isinstance(run_id, str):
-        return run_id
+    If *stats* is given, ``stats["rpc_calls"]`` is set to the number of
+    runner calls made (submission plus polls), also when an error is raised.
 
-    deadline = time.time() + TEST_TIMEOUT_SECONDS
+    The submission, start, completion and observation times described in
+    :func:`timing_breakdown` are stored in *stats* as they become known.
+
+    Passing *run_id* re-attaches to a run submitted earlier (see
+    ``--resume``) instead of submitting a new one; if the runner no longer
+    knows that id, the test is submitted again. *on_submit* is called with
+    the run id of every new submission.
+    """
+    stats = stats if stats is not None else {}
+    stats["rpc_calls"] = 0
+    if run_id is not None:
+        stats["rpc_calls"] += 1
+        try:
+            known = isinstance(await runner.get_test_status(test_run_id=run_id), dict)
+        except Exception:
+            known = False
+        if not known:
+            print(f"Run '{run_id}' of model '{model_id}' is unknown to the runner; resubmitting")
+            run_id = None
+
+    if run_id is None:
+        stats["rpc_calls"] += 1
+        run_id = await runner.test(
+            model_id=model_id, stage=False, cache="skip" if skip_cache else "check"
+        )
+
+        # Legacy synchronous runners returned the report dict directly instead
+        # of a run id; accept that so the script keeps working during a rollout.
+        stats["submitted_at"] = time.time()
+        if not isinstance(run_id, str):
+            stats["observed_at"] = stats["submitted_at"]
+            return run_id
+        if on_submit is not None:
+            on_submit(run_id)
+
+    submitted = stats.get("submitted_at") or time.time()
+    deadline = submitted + timeout
+    interval = TEST_POLL_INITIAL_SECONDS
+    was_queued = False
     while time.time() < deadline:
         status = await runner.get_test_status(test_run_id=run_id)
+        polled_at = time.time()
+        stats["rpc_calls"] += 1
+        queue_position = _queue_position(status)
         result = status.get("result") if isinstance(status, dict) else None
+        for key, value in (
+            ("runner_submitted_at", _submitted_at(status)),
+            ("started_at", _started_at(status)),
+        ):
+            if value is not None:
+                stats[key] = value
+        if queue_position == 0 and result is None and "started_polled_at" not in stats:
+            # A poll that already carries the result says nothing about when
+            # the run left the queue.
+            stats["started_polled_at"] = polled_at
         if result is not None:
+            stats["observed_at"] = polled_at
+            stats["completed_at"] = _completed_at(status)
             if isinstance(result, dict) and "error" in result:
                 raise RuntimeError(result["error"])
             return result
-        await asyncio.sleep(TEST_POLL_INTERVAL_SECONDS)
+        started = _execution_start(stats)
+        if started is not None:
+            deadline = started + timeout
+        elif queue_position:
+            deadline = min(polled_at, submitted + TEST_QUEUE_TIMEOUT_SECONDS) + timeout
+        if queue_position is not None:
+            if queue_position > 0:
+                was_queued = True
+            elif was_queued:
+                # Just left the queue: restart the schedule for the execution.
+                was_queued = False
+                interval = TEST_POLL_INITIAL_SECONDS
+        sleep, interval = next_poll_interval(interval, queue_position)
+        await asyncio.sleep(max(0.0, min(sleep, deadline - time.time())))
 
     raise asyncio.TimeoutError()
 
 
+class RunJournal:
+    """Append-only JSON-lines log of the tests of one (possibly resumed) run.
+
+    Records ``submitted`` (model id, runner run id and runner service) and
+    ``completed`` (model id and status) events, flushed as they happen, so that an
+    interrupted run can be continued with ``--resume``: completed models are
+    skipped and in-flight runs are re-attached through ``get_test_status``.
+    """
+
+    FILENAME = "run_journal.jsonl"
+
+    def __init__(self, path: Path, resume: bool = False) -> None:
+        self.path = path
+        self.completed: Dict[str, str] = {}  # model id -> status
+        self.in_flight: Dict[str, str] = {}  # model id -> run id
+        self.runner_of: Dict[str, str] = {}  # model id -> runner of in-flight run
+        if resume and path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn last line of a killed run
+                    model_id = event.get("model_id")
+                    if event.get("event") == "submitted":
+                        self.in_flight[model_id] = event["run_id"]
+                        if event.get("runner"):
+                            self.runner_of[model_id] = event["runner"]
+                    elif event.get("event") == "completed":
+                        self.in_flight.pop(model_id, None)
+                        self.runner_of.pop(model_id, None)
+                        self.completed[model_id] = event["status"]
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def _write(self, event: dict) -> None:
+        self._file.write(json.dumps({**event, "at": round(time.time(), 3)}) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def submitted(self, model_id: str, run_id: str, runner: Optional[str] = None) -> None:
+        self.in_flight[model_id] = run_id
+        event = {"event": "submitted", "model_id": model_id, "run_id": run_id}
+        if runner is not None:
+            self.runner_of[model_id] = runner
+            event["runner"] = runner
+        self._write(event)
+
+    def complete(self, model_id: str, status: str) -> None:
+        self.in_flight.pop(model_id, None)
+        self.runner_of.pop(model_id, None)
+        self.completed[model_id] = status
+        self._write({"event": "completed", "model_id": model_id, "status": status})
+
+    def close(self) -> None:
+        self._file.close()
+
+
+async def resolve_runners(server, service_ids: List[str]) -> Dict[str, ObjectProxy]:
+    """Connect to every model-runner service named by *service_ids*.
+
+    Plain ids are looked up directly (Hypha picks the least-loaded instance
+    if several serve the id); ids containing glob characters are matched
+    against the services listed by the server, each match becoming a runner
+    of its own. Ids starting with ``SIMULATOR_PREFIX`` create a
+    :class:`ModelRunnerSimulator` from the rest of the id and need no
+    *server*. Returns the runners keyed by service id.
+
+    Raises:
+        RuntimeError: If a glob matches no service.
+        ValueError: If a simulator spec is invalid.
+    """
+    runners: Dict[str, ObjectProxy] = {}
+    for pattern in service_ids:
+        if pattern.startswith(SIMULATOR_PREFIX):
+            runners[pattern] = ModelRunnerSimulator.from_spec(pattern)
+            continue
+        if any(c in pattern for c in "*?["):
+            services = await server.list_services(pattern)
+            ids = sorted(
+                s["id"] for s in services if fnmatch.fnmatchcase(s["id"], pattern)
+            )
+            if not ids:
+                raise RuntimeError(f"No model-runner service matches '{pattern}'")
+        else:
+            ids = [pattern]
+        for service_id in ids:
+            if service_id not in runners:
+                runners[service_id] = await server.get_service(
+                    service_id, {"mode": "select:min:get_load"}
+                )
+    return runners
+
+
+class RunnerUnavailable(RuntimeError):
+    """Raised when every runner's circuit breaker has given up."""
+
+
+class CircuitBreaker:
+    """Tracks consecutive runner-side failures of one model runner.
+
+    ``service-timeout`` and ``service-error`` outcomes extend the current
+    streak; any other outcome ends it. When the streak reaches *threshold*
+    (0 disables the breaker) the breaker opens until a probe succeeds. The
+    probe delay doubles on every failed probe and every re-trip, and is
+    reset by the next regular outcome.
+    """
+
+    def __init__(self, threshold: int = CIRCUIT_BREAKER_THRESHOLD) -> None:
+        self.threshold = threshold
+        self.streak: List[str] = []
+        self.open_since: Optional[float] = None
+        self.gave_up = False
+        self.trips = 0
+        self.probe_delay = CIRCUIT_PROBE_INITIAL_SECONDS
+
+    @property
+    def is_open(self) -> bool:
+        return self.open_since is not None
+
+    def record(self, model_id: str, status: str) -> List[str]:
+        """Count an outcome; return the models affected by an open breaker.
+
+        That is the whole streak when this outcome trips the breaker, or just
+        *model_id* if it failed while the breaker was already open.
+        """
+        if status not in SERVICE_FAILURE_STATUSES:
+            if not self.is_open:
+                self.streak = []
+                self.probe_delay = CIRCUIT_PROBE_INITIAL_SECONDS
+            return []
+        if self.is_open:
+            return [model_id]
+        self.streak.append(model_id)
+        if not self.threshold or len(self.streak) < self.threshold:
+            return []
+        self.open_since = time.time()
+        self.trips += 1
+        affected, self.streak = self.streak, []
+        return affected
+
+
+class RunnerPool:
+    """Routes each new test to the least-loaded available model runner.
+
+    The available runners' ``get_load`` values are polled at most every
+    ``RUNNER_LOAD_REFRESH_SECONDS``. Between polls, each runner's load is
+    estimated as its last polled load plus the change in the number of tests
+    this harness has in flight on it since that poll, so a burst is spread
+    over the runners instead of all going to the one least loaded at the
+    last poll; remaining ties go to the runner with fewer tests in flight.
+    A runner whose ``get_load`` fails or does not answer within
+    ``RUNNER_LOAD_TIMEOUT_SECONDS`` is only chosen if no other answers.
+    Runners whose :class:`CircuitBreaker` is open get no new tests and are
+    probed in the background; while all are open, :meth:`acquire` waits.
+    Per-runner outcome counts and busy time are kept in ``stats``.
+    """
+
+    def __init__(
+        self,
+        runners: Dict[str, ObjectProxy],
+        breaker_threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+    ) -> None:
+        self.runners = runners
+        self.breakers = {name: CircuitBreaker(breaker_threshold) for name in runners}
+        self.stats = {
+            name: {
+                "tested": 0,
+                "failed": 0,
+                "service-timeout": 0,
+                "service-error": 0,
+                "busy_seconds": 0.0,
+            }
+            for name in runners
+        }
+        self._in_flight = dict.fromkeys(runners, 0)
+        self._loads = dict.fromkeys(runners, 0.0)
+        self._in_flight_at_poll = dict.fromkeys(runners, 0)
+        self._loads_at = 0.0
+        self._lock = asyncio.Lock()
+        self._changed = asyncio.Event()
+        self._probes: set = set()
+
+    async def _load(self, name: str) -> float:
+        try:
+            return float(
+                await asyncio.wait_for(
+                    self.runners[name].get_load(), RUNNER_LOAD_TIMEOUT_SECONDS
+                )
+            )
+        except Exception:
+            return math.inf
+
+    async def acquire(self, preferred: Optional[str] = None) -> str:
+        """Reserve a slot on *preferred* if it is available, else the least loaded.
+
+        Raises:
+            RunnerUnavailable: If every runner's breaker has given up.
+        """
+        async with self._lock:
+            while True:
+                available = [n for n in self.runners if not self.breakers[n].is_open]
+                if available:
+                    break
+                if all(b.gave_up for b in self.breakers.values()):
+                    raise RunnerUnavailable(
+                        f"No model runner recovered within {CIRCUIT_GIVE_UP_SECONDS:.0f}s"
+                    )
+                self._changed.clear()
+                await self._changed.wait()
+            name = preferred if preferred in available else None
+            if name is None:
+                if len(available) > 1 and (
+                    time.time() - self._loads_at >= RUNNER_LOAD_REFRESH_SECONDS
+                ):
+                    loads = await asyncio.gather(*(self._load(n) for n in available))
+                    for n, load in zip(available, loads):
+                        self._loads[n] = load
+                        self._in_flight_at_poll[n] = self._in_flight[n]
+                    self._loads_at = time.time()
+                name = min(
+                    available,
+                    key=lambda n: (
+                        self._loads[n] + self._in_flight[n] - self._in_flight_at_poll[n],
+                        self._in_flight[n],
+                    ),
+                )
+            self._in_flight[name] += 1
+            return name
+
+    def release(self, name: str, model_id: str, test_report: dict) -> List[str]:
+        """Free the slot taken by :meth:`acquire` and count the test's outcome.
+
+        Returns the models to defer because the runner's breaker is open
+        (see :meth:`CircuitBreaker.record`).
+        """
+        self._in_flight[name] -= 1
+        stats = self.stats[name]
+        stats["tested"] += 1
+        if test_report["status"] in stats:
+            stats[test_report["status"]] += 1
+        stats["busy_seconds"] += test_report["harness"].get("duration_seconds") or 0.0
+
+        breaker = self.breakers[name]
+        was_open = breaker.is_open
+        affected = breaker.record(model_id, test_report["status"])
+        if breaker.is_open and not was_open:
+            print(
+                f"Runner '{name}' failed {len(affected)} tests in a row; "
+                "pausing submissions to it"
+            )
+            probe = asyncio.create_task(self._probe(name))
+            self._probes.add(probe)
+            probe.add_done_callback(self._probes.discard)
+        return affected
+
+    async def _probe(self, name: str) -> None:
+        """Probe an open runner with backoff until it answers or the breaker gives up."""
+        breaker = self.breakers[name]
+        while True:
+            await asyncio.sleep(breaker.probe_delay)
+            breaker.probe_delay = min(2 * breaker.probe_delay, CIRCUIT_PROBE_MAX_SECONDS)
+            try:
+                await asyncio.wait_for(
+                    self.runners[name].get_load(), CIRCUIT_PROBE_TIMEOUT_SECONDS
+                )
+            except Exception:
+                if time.time() - breaker.open_since >= CIRCUIT_GIVE_UP_SECONDS:
+                    breaker.gave_up = True
+                    print(f"Runner '{name}' did not recover; giving up on it")
+                    break
+                continue
+            print(
+                f"Runner '{name}' is back after {time.time() - breaker.open_since:.0f}s; "
+                "resuming submissions"
+            )
+            breaker.open_since = None
+            break
+        self._changed.set()
+
+    def close(self) -> None:
+        """Stop any background probes."""
+        for probe in list(self._probes):
+            probe.cancel()
+
+
+async def test_model(
+    runner: ObjectProxy,
+    model_id: str,
+    skip_cache: bool,
+    output_dir: Path,
+    journal: Optional[RunJournal] = None,
+    runner_name: Optional[str] = None,
+    timeout: float = TEST_TIMEOUT_SECONDS,
+) -> dict:
+    """Test one model, write its JSON report to *output_dir* and return it.
+
+    A test not done after *timeout* seconds and exceptions are turned into
+    ``service-timeout`` and ``service-error`` reports; a report without a status counts as ``failed``.
+    The report gains a ``harness`` entry with the RPCs spent on the test, its
+    wall-clock duration, completion time, timeout and :func:`timing_breakdown`,
+    plus the *runner_name* it ran on, if given. With a *journal*, the
+    submission and completion are logged, and a run left in flight by an
+    interrupted run on the same runner is re-attached rather than resubmitted.
+    """
+    model_start_time = time.time()
+    run_stats: dict = {}
+    run_id = None
+    if journal is not None and journal.runner_of.get(model_id) in (None, runner_name):
+        run_id = journal.in_flight.get(model_id)
+
+    try:
+        print(f"Testing model '{model_id}'...")
+        test_report = await run_test(
+            runner,
+            model_id=model_id,
+            skip_cache=skip_cache,
+            stats=run_stats,
+            run_id=run_id,
+            timeout=timeout,
+            on_submit=(
+                (lambda run_id: journal.submitted(model_id, run_id, runner_name))
+                if journal
+                else None
+            ),
+        )
+
+        model_execution_time = time.time() - model_start_time
+        print(
+            f"Model '{model_id}' tested in {model_execution_time:.2f} seconds "
+            f"({run_stats['rpc_calls']} runner RPCs)"
+        )
+
+    except asyncio.TimeoutError:
+        model_execution_time = time.time() - model_start_time
+        print(f"Model '{model_id}' timed out after {model_execution_time:.2f} seconds")
+        test_report = {
+            "id": model_id,
+            "status": "service-timeout",
+            "details": [{"errors": [{"msg": f"Test timed out after {timeout:.0f} seconds"}]}],
+        }
+    except Exception:
+        error_traceback = traceback.format_exc()
+        test_report = {
+            "id": model_id,
+            "status": "service-error",
+            "details": [{"errors": [{"msg": error_traceback}]}],
+        }
+        model_execution_time = time.time() - model_start_time
+        print(f"Model '{model_id}' failed after {model_execution_time:.2f} seconds")
+
+    if "status" not in test_report:
+        test_report["status"] = "failed"
+    # Harness-side measurements; the runner's own report fields are untouched.
+    test_report["harness"] = {
+        "rpc_calls": run_stats.get("rpc_calls", 0),
+        "duration_seconds": round(model_execution_time, 2),
+        "finished_at": round(time.time(), 3),
+        "timeout_seconds": round(timeout, 1),
+        "timing": timing_breakdown(run_stats),
+    }
+    if runner_name is not None:
+        test_report["harness"]["runner"] = runner_name
+
+    output_file = output_dir / f"{model_id}.json"
+    try:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(test_report, f, indent=2)
+    except Exception as e:
+        print(
+            f"Failed to write test report for '{model_id}' to {output_file}: {e}",
+            file=sys.stderr,
+        )
+    if journal is not None:
+        journal.complete(model_id, test_report["status"])
+    return test_report
+
+
+def report_runner_version(test_report: dict) -> Optional[str]:
+    """Runner version stamped in a report's ``env``, if any.
+
+    The runner records its own artifact version inside ``test_report["env"]``
+    as a row ``["bioimage-io/model-runner", "<version>", "", ""]``, alongside
+    rows for bioimageio.core, bioimageio.spec, and bioengine. Rows added
+    before the runner started stamping itself do not contain that name.
+    """
+    for row in test_report.get("env", []) or []:
+        if (
+            isinstance(row, (list, tuple))
+            and len(row) >= 2
+            and row[0] == RUNNER_ARTIFACT_ID
+            and row[1]
+        ):
+            return str(row[1])
+    return None
+
+
+async def iter_children(collection: str, page_size: int = LISTING_PAGE_SIZE):
+    """Yield the children of a ``bioimage-io`` collection page by page.
+
+    Uses the HTTP artifact endpoint with ``offset``/``limit`` pagination, so
+    callers can act on the first page while later ones are still being
+    fetched and no fixed limit truncates the listing.
+
+    Raises:
+        RuntimeError: If a page request fails.
+    """
+    offset = 0
+    async with httpx.AsyncClient(timeout=60) as client:
+        while True:
+            response = await client.get(
+                f"{ARTIFACTS_URL}/{collection}/children",
+                params={"offset": offset, "limit": page_size, "pagination": "true"},
+            )
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"Failed to list {collection} (offset {offset}): {response.status_code}"
+                )
+            page = response.json()
+            # Servers without pagination support return a plain list.
+            items = page if isinstance(page, list) else page.get("items", [])
+            for item in items:
+                yield item
+            offset += len(items)
+            total = None if isinstance(page, list) else page.get("total")
+            if len(items) < page_size or (total is not None and offset >= total):
+                break
+
+
+async def iter_models():
+    """Yield the model artifacts of the ``bioimage.io`` collection as they are listed."""
+    async for item in iter_children("bioimage.io"):
+        if item.get("type") == "model":
+            yield item
+
+
+async def fetch_previous_reports() -> Dict[str, dict]:
+    """Latest published test report per model alias, from ``test-reports``.
+
+    Each ``test-report-<alias>`` member carries the report as its manifest;
+    its ``last_modified`` is stored under ``"_last_modified"``. Returns an
+    empty dict (so every model is tested) if the listing fails.
+    """
+    reports = {}
+    try:
+        async for item in iter_children("test-reports"):
+            alias = item["id"].split("/")[-1]
+            manifest = item.get("manifest") or {}
+            if not alias.startswith("test-report-") or "status" not in manifest:
+                continue
+            report = dict(manifest)
+            report["_last_modified"] = item.get("last_modified") or 0
+            reports[alias[len("test-report-") :]] = report
+    except Exception as e:
+        print(f"Warning: failed to fetch previous test reports: {e}", file=sys.stderr)
+        return {}
+    return reports
+
+
+async def fetch_runner_version() -> Optional[str]:
+    """Version of the deployed model-runner app artifact, or None if unknown."""
+    url = f"{ARTIFACTS_URL}/{RUNNER_ARTIFACT_ID.split('/')[-1]}"
+    try:
+        async with httpx.AsyncClient(timeout=30) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+            artifact = response.json()
+    except Exception as e:
+        print(f"Warning: failed to read {RUNNER_ARTIFACT_ID}: {e}", file=sys.stderr)
+        return None
+    version = (artifact.get("manifest") or {}).get("version")
+    if not version and artifact.get("versions"):
+        version = artifact["versions"][-1].get("version")
+    return str(version) if version else None
+
+
+def in_drift_sample(model_id: str, fraction: float, day: int) -> bool:
+    """Whether *model_id* is in the rotating drift sample for *day*.
+
+    Models are spread over ``round(1 / fraction)`` buckets by a stable hash,
+    and one bucket is selected per day.
+    """
+    if fraction <= 0:
+        return False
+    buckets = max(1, round(1 / fraction))
+    return zlib.crc32(model_id.encode()) % buckets == day % buckets
+
+
+def retest_reason(
+    item: dict,
+    report: Optional[dict],
+    runner_version: Optional[str],
+    drift_fraction: float,
+    day: int,
+) -> Optional[str]:
+    """Why model artifact *item* must be re-tested, or None if *report* still holds."""
+    model_id = item["id"].split("/")[-1]
+    if report is None:
+        return "no-previous-report"
+    if report.get("status") in RETEST_STATUSES:
+        return "previous-service-failure"
+    if (item.get("last_modified") or 0) > report.get("_last_modified", 0):
+        return "model-changed"
+    if runner_version and report_runner_version(report) != runner_version:
+        return "runner-changed"
+    if in_drift_sample(model_id, drift_fraction, day):
+        return "drift-sample"
+    return None
+
+
+def report_files(directory: Path, recursive: bool = False) -> List[Path]:
+    """Per-model JSON report files in *directory* (the summary file excluded)."""
+    files = directory.rglob("*.json") if recursive else directory.glob("*.json")
+    return sorted(f for f in files if f.name != SUMMARY_FILENAME)
+
+
+def record_outcome(history: TestHistory, model_id: str, test_report: dict) -> None:
+    """Append the outcome in *test_report* to *history*.
+
+    Carried-over and deferred reports are skipped: they are not outcomes of
+    a test.
+    """
+    harness = test_report.get("harness") or {}
+    if harness.get("carried_over") or test_report.get("status") == "deferred":
+        return
+    history.record(
+        model_id,
+        test_report.get("status", "failed"),
+        duration_seconds=harness.get("duration_seconds"),
+        runner_version=report_runner_version(test_report),
+        tested_at=harness.get("finished_at"),
+        signature=error_signature(test_report),
+    )
+
+
+def record_reports_to_history(reports_dir: Path, history_db: Path) -> None:
+    """Append every report in *reports_dir* to the history database.
+
+    Used in CI after merging shard reports. Reports written before the
+    harness recorded ``finished_at`` use the file's modification time.
+    """
+    recorded = 0
+    with TestHistory(history_db) as history:
+        for json_file in report_files(reports_dir):
+            try:
+                with open(json_file, "r") as f:
+                    test_report = json.load(f)
+                harness = test_report.setdefault("harness", {})
+                harness.setdefault("finished_at", json_file.stat().st_mtime)
+                record_outcome(history, json_file.stem, test_report)
+                recorded += 1
+            except Exception as e:
+                print(f"Error processing {json_file}: {e}", file=sys.stderr)
+    print(f"Recorded {recorded} report(s) in: {history_db}")
+
+
+def print_history(history_db: Path, query: str, days: int = 30) -> None:
+    """Print one of the history queries (``trend``, ``new-failures``, ``regressions``) as JSON."""
+    with TestHistory(history_db) as history:
+        if query == "trend":
+            result = history.pass_rate_trend(days)
+        elif query == "new-failures":
+            result = history.newly_failing()
+        else:
+            result = history.duration_regressions()
+    print(json.dumps(result, indent=2))
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse ``"i/n"`` (1-based shard index, shard count) for ``--shard``."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected i/n, got {value!r}")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"Shard index must be in 1..n, got {value!r}")
+    return index, count
+
+
+def load_durations(path: Path) -> Dict[str, float]:
+    """Historical test duration per model id.
+
+    *path* is either a directory of per-model JSON reports written by a
+    previous run (``harness.duration_seconds``; carried-over and deferred
+    reports are skipped), a history database (``.sqlite``/``.db``; median of recent
+    runs) or a JSON file mapping model id to seconds, as written by
+    :func:`save_durations`. Returns an empty dict if *path* does not exist.
+    """
+    if not path.exists():
+        return {}
+    if path.suffix in (".sqlite", ".db"):
+        with TestHistory(path) as history:
+            return history.median_durations()
+    if path.is_file():
+        with open(path, "r") as f:
+            return {k: float(v) for k, v in json.load(f).items()}
+    durations = {}
+    for json_file in report_files(path):
+        try:
+            with open(json_file, "r") as f:
+                harness = json.load(f).get("harness") or {}
+        except Exception as e:
+            print(f"Error processing {json_file}: {e}", file=sys.stderr)
+            continue
+        if harness.get("carried_over") or harness.get("deferred"):
+            continue
+        if "duration_seconds" in harness:
+            durations[json_file.stem] = float(harness["duration_seconds"])
+    return durations
+
+
+def save_durations(reports_dir: Path, path: Path, previous: Optional[Path] = None) -> None:
+    """Write the durations in *reports_dir* to *path* as ``{model_id: seconds}``.
+
+    Entries from *previous* (a durations file) are kept for models that were
+    not tested in this run, so the history survives incremental runs.
+    """
+    durations = load_durations(previous) if previous else {}
+    durations.update(load_durations(reports_dir))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(durations.items())), f, indent=2)
+    print(f"Saved {len(durations)} model duration(s) to: {path}")
+
+
+def model_timeout(durations: List[float], last: Optional[dict] = None) -> float:
+    """Test timeout for a model with the given recent *durations*.
+
+    *durations* are of completed tests; *last* is the model's most recent
+    outcome (see :meth:`TestHistory.latest`), if known. See the
+    ``TEST_TIMEOUT_*`` constants.
+    """
+    timeout = TEST_TIMEOUT_SECONDS
+    if len(durations) >= TEST_TIMEOUT_MIN_SAMPLES:
+        timeout = TEST_TIMEOUT_MARGIN * _percentile(sorted(durations), 99)
+    if last and last["status"] == "service-timeout" and last.get("duration_seconds"):
+        timeout = max(timeout, 2 * last["duration_seconds"])
+    return float(min(TEST_TIMEOUT_CEILING_SECONDS, max(TEST_TIMEOUT_FLOOR_SECONDS, timeout)))
+
+
+def load_timeouts(
+    history_db: Optional[Path], overrides: Optional[Path] = DEFAULT_TIMEOUT_OVERRIDES
+) -> Dict[str, float]:
+    """Per-model test timeouts from *history_db* and the *overrides* file.
+
+    Timeouts are derived by :func:`model_timeout` from the durations of
+    passed, valid-format and failed tests (service failures say nothing
+    about how long a model takes). *overrides* is a JSON file mapping model
+    id to seconds; its entries win and are not clamped. Either source may be
+    missing. Models without an entry use ``TEST_TIMEOUT_SECONDS``.
+    """
+    timeouts: Dict[str, float] = {}
+    if history_db and history_db.exists():
+        with TestHistory(history_db) as history:
+            durations = history.durations(statuses=COMPLETED_STATUSES)
+            latest = history.latest()
+        for model_id in durations.keys() | latest.keys():
+            timeouts[model_id] = model_timeout(
+                durations.get(model_id, []), latest.get(model_id)
+            )
+    if overrides and overrides.exists():
+        with open(overrides, "r", encoding="utf-8") as f:
+            timeouts.update({k: float(v) for k, v in json.load(f).items()})
+    return timeouts
+
+
+def shard_models(
+    model_ids: List[str], durations: Dict[str, float], index: int, count: int
+) -> List[str]:
+    """Return shard *index* (1-based) of *count* duration-balanced shards.
+
+    Longest-processing-time-first: models are taken in order of decreasing
+    historical duration and each goes to the currently lightest shard.
+    Models without history are assumed to take the median known duration.
+    The assignment is deterministic, so every shard computes the same split.
+    """
+    default = (
+        statistics.median(durations.values()) if durations else DEFAULT_MODEL_DURATION_SECONDS
+    )
+    loads = [0.0] * count
+    shards: List[List[str]] = [[] for _ in range(count)]
+    for model_id in sorted(model_ids, key=lambda m: (-durations.get(m, default), m)):
+        lightest = min(range(count), key=lambda i: (loads[i], i))
+        loads[lightest] += durations.get(model_id, default)
+        shards[lightest].append(model_id)
+    print(
+        f"Shard {index}/{count}: {len(shards[index - 1])} model(s), "
+        f"~{loads[index - 1] / 60:.1f} min of historical test time "
+        f"(shard range {min(loads) / 60:.1f}-{max(loads) / 60:.1f} min)"
+    )
+    return sorted(shards[index - 1])
+
+
+def merge_report_dirs(sources: List[Path], dest: Path) -> None:
+    """Merge per-model report directories (e.g. one per CI shard) into *dest*.
+
+    If a model appears in several sources, a report from an actual test run
+    wins over a carried-over one; otherwise the last source wins.
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    merged: Dict[str, Path] = {}
+    for source in sources:
+        for json_file in report_files(source, recursive=True):
+            current = merged.get(json_file.name)
+            if current is not None and _is_carried_over(json_file) and not _is_carried_over(current):
+                continue
+            merged[json_file.name] = json_file
+    for name, json_file in merged.items():
+        if json_file.resolve() != (dest / name).resolve():
+            shutil.copyfile(json_file, dest / name)
+    # stderr, so the output of a following --analyze-reports stays eval-able.
+    print(
+        f"Merged {len(merged)} report(s) from {len(sources)} director(ies) into: {dest}",
+        file=sys.stderr,
+    )
+
+
+def _is_carried_over(json_file: Path) -> bool:
+    try:
+        with open(json_file, "r") as f:
+            return bool((json.load(f).get("harness") or {}).get("carried_over"))
+    except Exception:
+        return False
+
+
 async def test_bmz_models(
     model_ids: Optional[List[str]] = None,
     reports_dir: Optional[Path] = None,
     skip_cache: bool = False,
-    service_id: str = DEFAULT_SERVICE_ID,
+    service_ids: Optional[List[str]] = None,
+    concurrency: int = 1,
+    incremental: bool = False,
+    drift_fraction: float = INCREMENTAL_DRIFT_FRACTION,
+    shard: Optional[Tuple[int, int]] = None,
+    durations_from: Optional[Path] = None,
+    history_db: Optional[Path] = DEFAULT_HISTORY_DB,
+    resume: bool = False,
+    breaker_threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+    timeout_overrides: Optional[Path] = DEFAULT_TIMEOUT_OVERRIDES,
 ) -> None:
     """Test BioImage.IO models and generate test reports.
 
@@ -73,47 +1092,81 @@ async def test_bmz_models(
     ``bioimage-io/test-reports`` collection itself.
 
     Args:
-        model_ids: List of model IDs to test. If None, fetches all models.
+        model_ids: List of model IDs to test. If None, all models are
+            tested; they are listed page by page and queued for testing as
+            each page arrives.
         reports_dir: Directory where per-model JSON test reports are written.
         skip_cache: Whether to skip cache during model testing.
-        service_id: Fully-qualified id of the model-runner service to use.
+        service_ids: Fully-qualified ids or globs of the model-runner
+            services to use (see :func:`resolve_runners`); defaults to
+            ``DEFAULT_SERVICE_ID``. With several runners each test goes to
+            the least-loaded one (see :class:`RunnerPool`).
+        concurrency: Number of test runs kept in flight; a new model is
+            submitted as soon as one completes. Capped at
+            ``MAX_TEST_CONCURRENCY``.
+        incremental: Only test models for which :func:`retest_reason`
+            gives a reason; the previous reports of the other
+            models are written to *reports_dir* unchanged, marked as
+            ``carried_over`` under ``harness``.
+        drift_fraction: Share of unchanged models re-tested per day in
+            incremental mode.
+        shard: ``(index, count)`` to test only one duration-balanced share
+            of the models (see :func:`shard_models`). The complete model
+            list is sharded before the incremental filter is applied, so
+            shards that fetch the previous reports at different moments
+            still split the models without gaps or overlap; each shard
+            writes the carried-over reports of its own models.
+        durations_from: Reports directory or durations file used to balance
+            shards (see :func:`load_durations`).
+        history_db: SQLite database the final outcome of every model tested
+            in this run is appended to, or None to keep no history. Outcomes
+            are recorded as soon as they can no longer be deferred, the rest
+            when the run ends (deferred models are not recorded); a resumed
+            run also records the models completed before the interruption.
+        resume: Continue an interrupted run from the :class:`RunJournal` in
+            *reports_dir*: models completed there (whose report still
+            exists) are not tested again and in-flight runs are re-attached.
+            Deferred models are tested again.
+        breaker_threshold: Consecutive service failures after which a
+            runner's :class:`CircuitBreaker` opens (0 disables it). Models
+            caught by an outage get a ``deferred`` report and are re-tested
+            once after the other models.
+        timeout_overrides: JSON file of per-model timeouts that take
+            precedence over the ones derived from history (see
+            :func:`load_timeouts`). The history is *durations_from* if it is
+            a database, else *history_db*.
 
     Raises:
-        RuntimeError: If fetching model IDs fails.
+        RuntimeError: If fetching model IDs fails or a service glob matches
+            no runner.
     """
     start_time = time.time()
 
-    server_url = "https://hypha.aicell.io"
-    token = os.environ.get("HYPHA_TOKEN") or await login({"server_url": server_url})
-    server = await connect_to_server(
-        {"server_url": server_url, "token": token, "method_timeout": 300}
-    )
+    service_ids = service_ids or [DEFAULT_SERVICE_ID]
+    server = None
+    if not all(s.startswith(SIMULATOR_PREFIX) for s in service_ids):
+        server_url = "https://hypha.aicell.io"
+        token = os.environ.get("HYPHA_TOKEN") or await login({"server_url": server_url})
+        server = await connect_to_server(
+            {"server_url": server_url, "token": token, "method_timeout": 300}
+        )
 
-    print(f"Using model-runner service '{service_id}'")
-    model_runner = await server.get_service(
-        service_id, {"mode": "select:min:get_load"}
+    runners = RunnerPool(
+        await resolve_runners(server, service_ids),
+        breaker_threshold=breaker_threshold,
     )
-
-    # Fetch all model IDs if not provided
-    if model_ids is None:
-        url = "https://hypha.aicell.io/bioimage-io/artifacts/bioimage.io/children?limit=10000"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            if response.status_code != 200:
-                raise RuntimeError(f"Failed to fetch model IDs: {response.status_code}")
-            model_ids = [
-                item["id"].split("/")[1]
-                for item in response.json()
-                if item["type"] == "model"
-            ]
-            model_ids = sorted(model_ids)
+    for service_id in runners.runners:
+        print(f"Using model-runner service '{service_id}'")
 
     # Initialize counters for overall statuses
-    total_passed = 0
-    total_valid_format = 0
-    total_failed = 0
-    total_timeout = 0
-    total_error = 0
+    status_counts = {
+        "passed": 0,
+        "valid-format": 0,
+        "failed": 0,
+        "service-timeout": 0,
+        "service-error": 0,
+        "deferred": 0,
+    }
 
     output_dir = (
         reports_dir
@@ -121,157 +1174,425 @@ async def test_bmz_models(
     )
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Test each model
-    for model_id in model_ids:
-        model_start_time = time.time()
-
+    previous_reports: Dict[str, dict] = {}
+    runner_version = None
+    if incremental:
+        previous_reports, runner_version = await asyncio.gather(
+            fetch_previous_reports(), fetch_runner_version()
+        )
+        print(f"Deployed model-runner version: {runner_version or 'unknown'}")
+    day = int(time.time() // 86400)
+    reasons: Dict[str, int] = {}
+    carried = 0
+    resumed = 0
+
+    journal = RunJournal(output_dir / RunJournal.FILENAME, resume=resume)
+
+    async def candidates():
+        # Fetch all model IDs if not provided, page by page.
+        if model_ids is not None and not incremental:
+            for model_id in model_ids:
+                yield {"id": f"bioimage-io/{model_id}"}
+            return
+        wanted = set(model_ids) if model_ids is not None else None
+        async for item in iter_models():
+            if wanted is None or item["id"].split("/")[-1] in wanted:
+                yield item
+
+    def needs_test(item: dict) -> bool:
+        """Apply --incremental; write the carried-over report if it still holds."""
+        nonlocal carried
+        if not incremental:
+            return True
+        model_id = item["id"].split("/")[-1]
+        report = previous_reports.get(model_id)
+        reason = retest_reason(item, report, runner_version, drift_fraction, day)
+        if reason is not None:
+            reasons[reason] = reasons.get(reason, 0) + 1
+            return True
+        report = {k: v for k, v in report.items() if k != "_last_modified"}
+        report["harness"] = {"rpc_calls": 0, "carried_over": True}
+        if report["status"] in status_counts:
+            status_counts[report["status"]] += 1
+        with open(output_dir / f"{model_id}.json", "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        carried += 1
+        return False
+
+    def already_done(model_id: str) -> bool:
+        """Apply --resume: count a model completed earlier whose report still exists."""
+        nonlocal resumed
+        if model_id not in journal.completed:
+            return False
         try:
-            print(f"Testing model '{model_id}'...")
-            test_report = await run_test(
-                model_runner, model_id=model_id, skip_cache=skip_cache
-            )
-
-            model_execution_time = time.time() - model_start_time
-            print(f"Model '{model_id}' tested in {model_execution_time:.2f} seconds")
+            with open(output_dir / f"{model_id}.json", "r", encoding="utf-8") as f:
+                status = json.load(f).get("status", "failed")
+        except Exception:
+            return False  # report lost; test the model again
+        if status == "deferred":
+            return False
+        if status in status_counts:
+            status_counts[status] += 1
+        resumed += 1
+        resumed_ids.append(model_id)
+        return True
+
+    concurrency = max(1, min(concurrency, MAX_TEST_CONCURRENCY))
+    if concurrency > 1:
+        print(f"Keeping up to {concurrency} test runs in flight")
+    queue: asyncio.Queue = asyncio.Queue()
+    rpc_calls: List[int] = []
+    timings: List[dict] = []
+    timeouts = load_timeouts(
+        durations_from
+        if durations_from and durations_from.suffix in (".sqlite", ".db")
+        else history_db,
+        timeout_overrides,
+    )
+    if timeouts:
+        print(
+            f"Per-model timeouts for {len(timeouts)} model(s) "
+            f"(median {statistics.median(timeouts.values()):.0f}s, "
+            f"default {TEST_TIMEOUT_SECONDS}s)"
+        )
+    history = TestHistory(history_db) if history_db else None
 
-        except asyncio.TimeoutError:
-            model_execution_time = time.time() - model_start_time
+    async def produce() -> None:
+        # Models are queued as listing pages arrive, so testing starts right
+        # away. Sharding needs the complete list to balance it; it is split
+        # before the incremental filter, whose outcome depends on when each
+        # shard fetched the previous reports.
+        try:
+            if shard is None:
+                async for item in candidates():
+                    model_id = item["id"].split("/")[-1]
+                    if needs_test(item) and not already_done(model_id):
+                        queue.put_nowait(model_id)
+            else:
+                items = {item["id"].split("/")[-1]: item async for item in candidates()}
+                durations = load_durations(durations_from) if durations_from else {}
+                for model_id in shard_models(list(items), durations, *shard):
+                    if needs_test(items[model_id]) and not already_done(model_id):
+                        queue.put_nowait(model_id)
+        finally:
+            for _ in range(concurrency):
+                queue.put_nowait(None)
+        if incremental:
             print(
-                f"Model '{model_id}' timed out after {model_execution_time:.2f} seconds"
+                f"Incremental run: {sum(reasons.values())} model(s) to test "
+                f"({', '.join(f'{k}: {v}' for k, v in sorted(reasons.items())) or 'none'}), "
+                f"carried over {carried} unchanged report(s)"
             )
-            test_report = {
-                "id": model_id,
-                "status": "service-timeout",
-                "details": [{"errors": [{"msg": "Test timed out after 5 minutes"}]}],
-            }
+        if resume:
+            print(f"Resumed: {resumed} model(s) already completed")
+
+    outcomes: Dict[str, str] = {}  # model id -> latest status of this run
+    resumed_ids: List[str] = []  # completed by the run this one resumes
+    recorded: set = set()  # models whose outcome is in the history
+    deferred: List[str] = []
+    retested: set = set()
+
+    def defer(model_id: str, reason: str) -> None:
+        """Rewrite the model's report as ``deferred``, keeping the previous status."""
+        report_file = output_dir / f"{model_id}.json"
+        try:
+            test_report = json.loads(report_file.read_bytes())
         except Exception:
-            error_traceback = traceback.format_exc()
-            test_report = {
-                "id": model_id,
-                "status": "service-error",
-                "details": [{"errors": [{"msg": error_traceback}]}],
-            }
-            model_execution_time = time.time() - model_start_time
-            print(f"Model '{model_id}' failed after {model_execution_time:.2f} seconds")
-
-        if "status" not in test_report:
-            test_report["status"] = "failed"
-        status = test_report["status"]
-        if status == "passed":
-            total_passed += 1
-        elif status == "valid-format":
-            total_valid_format += 1
-        elif status == "failed":
-            total_failed += 1
-        elif status == "service-timeout":
-            total_timeout += 1
-        elif status == "service-error":
-            total_error += 1
-
-        output_file = output_dir / f"{model_id}.json"
+            test_report = {"id": model_id, "details": []}
+        previous_status = test_report.get("status")
+        test_report["status"] = "deferred"
+        test_report.setdefault("harness", {"rpc_calls": 0})["deferred"] = {
+            "reason": reason,
+            "previous_status": previous_status,
+        }
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
+            with open(report_file, "w", encoding="utf-8") as f:
                 json.dump(test_report, f, indent=2)
         except Exception as e:
-            print(
-                f"Failed to write test report for '{model_id}' to {output_file}: {e}",
-                file=sys.stderr,
+            print(f"Failed to write deferred report for '{model_id}': {e}", file=sys.stderr)
+        outcomes[model_id] = "deferred"
+        deferred.append(model_id)
+        journal.complete(model_id, "deferred")
+
+    async def worker() -> None:
+        # Workers share one queue, so each model is tested exactly once
+        # (deferred models once more, in a second round).
+        while (model_id := await queue.get()) is not None:
+            try:
+                runner_name = await runners.acquire(journal.runner_of.get(model_id))
+            except RunnerUnavailable as e:
+                defer(model_id, str(e))
+                continue
+            test_report = await test_model(
+                runners.runners[runner_name],
+                model_id,
+                skip_cache,
+                output_dir,
+                journal=journal,
+                runner_name=runner_name,
+                timeout=timeouts.get(model_id, TEST_TIMEOUT_SECONDS),
             )
+            outcomes[model_id] = test_report["status"]
+            if history is not None and (
+                test_report["status"] not in SERVICE_FAILURE_STATUSES or model_id in retested
+            ):
+                # Final already: only service failures can still be deferred.
+                record_history([model_id])
+            rpc_calls.append(test_report["harness"]["rpc_calls"])
+            timings.append(test_report["harness"]["timing"])
+            for affected in runners.release(runner_name, model_id, test_report):
+                if affected not in retested:
+                    defer(affected, f"outage of runner '{runner_name}'")
+
+    def record_history(model_ids) -> None:
+        """Append the final outcomes of *model_ids* from their report files.
+
+        Deferred reports are skipped by :func:`record_outcome`, and re-recording
+        an outcome is a no-op, so this is safe to call again for the same model.
+        """
+        for model_id in model_ids:
+            if model_id in recorded:
+                continue
+            try:
+                with open(output_dir / f"{model_id}.json", "r", encoding="utf-8") as f:
+                    test_report = json.load(f)
+                record_outcome(history, model_id, test_report)
+            except Exception as e:
+                print(f"Failed to record '{model_id}' in {history_db}: {e}", file=sys.stderr)
+                continue
+            if test_report.get("status") != "deferred":
+                recorded.add(model_id)
+
+    try:
+        # Let every worker drain the queue even if the listing fails midway,
+        # then surface the failure.
+        results = await asyncio.gather(
+            produce(), *(worker() for _ in range(concurrency)), return_exceptions=True
+        )
+        failed = any(isinstance(result, BaseException) for result in results)
+        if deferred and not failed and not all(b.gave_up for b in runners.breakers.values()):
+            print(f"Re-testing {len(deferred)} deferred model(s)")
+            retested.update(deferred)
+            for model_id in deferred:
+                queue.put_nowait(model_id)
+            deferred.clear()
+            for _ in range(concurrency):
+                queue.put_nowait(None)
+            results += await asyncio.gather(
+                *(worker() for _ in range(concurrency)), return_exceptions=True
+            )
+    finally:
+        runners.close()
+        for runner in runners.runners.values():
+            if isinstance(runner, ModelRunnerSimulator):
+                runner.close()
+        journal.close()
+        if history is not None:
+            # Outcomes that could still have been deferred are recorded once
+            # the run settles; so are those of models completed by the run
+            # this one resumes, which may have been killed before recording.
+            record_history([*resumed_ids, *outcomes])
+            history.close()
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    for status in outcomes.values():
+        if status in status_counts:
+            status_counts[status] += 1
+    total_models = len(outcomes) + carried + resumed
+    total_passed = status_counts["passed"]
+    total_valid_format = status_counts["valid-format"]
+    total_failed = status_counts["failed"]
+    total_timeout = status_counts["service-timeout"]
+    total_error = status_counts["service-error"]
 
     total_execution_time = time.time() - start_time
 
     # Print summary
-    perc_passed = (total_passed / len(model_ids)) * 100 if model_ids else 0
-    perc_valid_format = (total_valid_format / len(model_ids)) * 100 if model_ids else 0
-    perc_failed = (total_failed / len(model_ids)) * 100 if model_ids else 0
-    perc_timeout = (total_timeout / len(model_ids)) * 100 if model_ids else 0
-    perc_error = (total_error / len(model_ids)) * 100 if model_ids else 0
+    perc_passed = (total_passed / total_models) * 100 if total_models else 0
+    perc_valid_format = (total_valid_format / total_models) * 100 if total_models else 0
+    perc_failed = (total_failed / total_models) * 100 if total_models else 0
+    perc_timeout = (total_timeout / total_models) * 100 if total_models else 0
+    perc_error = (total_error / total_models) * 100 if total_models else 0
     formatted_time = time.strftime("%H:%M:%S", time.gmtime(total_execution_time))
 
     print(
-        f"Total models with status passed: {total_passed}/{len(model_ids)} ({perc_passed:.2f}%)"
+        f"Total models with status passed: {total_passed}/{total_models} ({perc_passed:.2f}%)"
     )
     print(
-        f"Total models with status valid-format: {total_valid_format}/{len(model_ids)} ({perc_valid_format:.2f}%)"
+        f"Total models with status valid-format: {total_valid_format}/{total_models} ({perc_valid_format:.2f}%)"
     )
     print(
-        f"Total models with status failed: {total_failed}/{len(model_ids)} ({perc_failed:.2f}%)"
+        f"Total models with status failed: {total_failed}/{total_models} ({perc_failed:.2f}%)"
     )
     print(
-        f"Total models with execution timeout: {total_timeout}/{len(model_ids)} ({perc_timeout:.2f}%)"
+        f"Total models with execution timeout: {total_timeout}/{total_models} ({perc_timeout:.2f}%)"
     )
     print(
-        f"Total models with execution error: {total_error}/{len(model_ids)} ({perc_error:.2f}%)"
+        f"Total models with execution error: {total_error}/{total_models} ({perc_error:.2f}%)"
     )
+    if status_counts["deferred"]:
+        print(
+            f"Total models deferred by a runner outage: {status_counts['deferred']}/{total_models}"
+        )
+    if rpc_calls:
+        print(
+            f"Runner RPCs: {sum(rpc_calls)} total, "
+            f"{sum(rpc_calls) / len(rpc_calls):.1f} per test, max {max(rpc_calls)}"
+        )
+    for key, label in (
+        ("queue_wait_seconds", "Queue wait"),
+        ("execution_seconds", "Execution"),
+        ("polling_overhead_seconds", "Polling overhead"),
+    ):
+        values = [t[key] for t in timings if t.get(key) is not None]
+        if values:
+            print(
+                f"{label}: mean {statistics.mean(values):.2f}s, "
+                f"max {max(values):.2f}s over {len(values)} test(s)"
+            )
+    for service_id, stats in runners.stats.items():
+        trips = runners.breakers[service_id].trips
+        if len(runners.runners) > 1 or trips:
+            print(
+                f"Runner '{service_id}': {stats['tested']} test(s) "
+                f"({stats['tested'] / (total_execution_time / 60):.2f}/min, "
+                f"busy {stats['busy_seconds']:.0f}s), "
+                f"{stats['failed']} failed, {stats['service-timeout']} timed out, "
+                f"{stats['service-error']} service error(s), "
+                f"circuit breaker tripped {trips} time(s)"
+            )
+    for service_id, runner in runners.runners.items():
+        if isinstance(runner, ModelRunnerSimulator):
+            print(
+                f"Simulator '{service_id}': "
+                + ", ".join(f"{k} {v}" for k, v in runner.stats.items())
+            )
     print(f"Total execution time: {formatted_time} (hh:mm:ss)")
     print(f"Saved model test reports to: {output_dir}")
 
 
+def _load_report(json_file: Path) -> Optional[dict]:
+    """Parse one report, or return None (with a warning) if it is unreadable.
+
+    A report being written while the directory is read, or left truncated by
+    a killed run, must not abort the analysis.
+    """
+    try:
+        test_report = json.loads(json_file.read_bytes())
+        if not isinstance(test_report, dict):
+            raise ValueError("not a JSON object")
+        return test_report
+    except Exception as e:
+        print(f"Error processing {json_file}: {e}", file=sys.stderr)
+        return None
+
+
+def _percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """Linearly interpolated *q*-th percentile of already sorted values."""
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return round(sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low), 2)
+
+
 def analyze_existing_test_reports(reports_dir: Path) -> None:
     """Analyze existing test reports and output summary for GitHub Actions.
 
-    Reads all JSON test report files from the given directory, calculates
-    statistics, and prints environment variables suitable for GitHub Actions.
+    Reads all JSON test report files from the given directory in parallel,
+    calculates statistics, prints environment variables suitable for GitHub
+    Actions and writes the same figures, plus the slowest models, to
+    ``summary.json`` in *reports_dir*. Unreadable (e.g. partially written)
+    reports are skipped and counted separately.
+
+    Durations are the harness-measured ``harness.duration_seconds`` of
+    models tested in this run; carried-over and deferred reports are skipped. The
+    ``harness.timing`` breakdowns are aggregated the same way, separating
+    time spent queued on the runner from time spent executing. Tests are
+    also broken down by the runner service they ran on (``harness.runner``).
 
     Args:
         reports_dir: Path to directory containing test report JSON files.
 
     Outputs (printed to stdout):
         TOTAL_MODELS, PASSED, VALID_FORMAT, FAILED, TIMEOUT, ERROR,
-        PASSED_RATE, VALID_FORMAT_RATE, FAILED_RATE, TIMEOUT_RATE, ERROR_RATE
+        PASSED_RATE, VALID_FORMAT_RATE, FAILED_RATE, TIMEOUT_RATE, ERROR_RATE,
+        DEFERRED, RUNNER_VERSION, UNREADABLE_REPORTS, DURATION_P50, DURATION_P90,
+        DURATION_P99, QUEUE_WAIT_P50, EXECUTION_P50
     """
     if not reports_dir.exists():
         print("TOTAL_MODELS=0")
         return
 
     # Find all JSON files in the reports directory
-    json_files = list(reports_dir.glob("*.json"))
+    json_files = report_files(reports_dir)
 
     if not json_files:
         print("TOTAL_MODELS=0")
         return
 
-    total_models = len(json_files)
-    passed = 0
-    valid_format = 0
-    failed = 0
-    timeout = 0
-    error = 0
+    with ThreadPoolExecutor(max_workers=min(32, 4 * (os.cpu_count() or 1))) as pool:
+        reports = list(pool.map(_load_report, json_files))
+
+    counts = {
+        status: 0
+        for status in (
+            "passed",
+            "valid-format",
+            "failed",
+            "service-timeout",
+            "service-error",
+            "deferred",
+        )
+    }
     runner_versions = set()
+    durations: List[Tuple[float, str]] = []
+    unreadable = 0
+    timing_values: Dict[str, List[float]] = {
+        "queue_wait_seconds": [],
+        "execution_seconds": [],
+        "polling_overhead_seconds": [],
+    }
+    per_runner: Dict[str, dict] = {}
+
+    for json_file, test_report in zip(json_files, reports):
+        if test_report is None:
+            unreadable += 1
+            continue
+        status = test_report.get("status", "failed")
+        if status in counts:
+            counts[status] += 1
 
-    for json_file in json_files:
-        try:
-            with open(json_file, "r") as f:
-                test_report = json.load(f)
-
-            status = test_report.get("status", "failed")
-            if status == "passed":
-                passed += 1
-            elif status == "valid-format":
-                valid_format += 1
-            elif status == "failed":
-                failed += 1
-            elif status == "service-timeout":
-                timeout += 1
-            elif status == "service-error":
-                error += 1
-
-            # The runner records its own artifact version inside test_report["env"]
-            # as a row ["bioimage-io/model-runner", "<version>", "", ""], alongside
-            # rows for bioimageio.core, bioimageio.spec, and bioengine. Rows added
-            # before the runner started stamping itself do not contain that name.
-            for row in test_report.get("env", []) or []:
-                if (
-                    isinstance(row, (list, tuple))
-                    and len(row) >= 2
-                    and row[0] == "bioimage-io/model-runner"
-                    and row[1]
-                ):
-                    runner_versions.add(str(row[1]))
-                    break
+        runner_version = report_runner_version(test_report)
+        if runner_version:
+            runner_versions.add(runner_version)
 
-        except Exception as e:
-            print(f"Error processing {json_file}: {e}", file=sys.stderr)
+        harness = test_report.get("harness") or {}
+        if harness.get("carried_over") or harness.get("deferred"):
+            continue
+        if harness.get("duration_seconds") is not None:
+            durations.append((float(harness["duration_seconds"]), json_file.stem))
+        if harness.get("runner"):
+            runner = per_runner.setdefault(
+                harness["runner"], {"tested": 0, "counts": {}, "busy_seconds": 0.0}
+            )
+            runner["tested"] += 1
+            runner["counts"][status] = runner["counts"].get(status, 0) + 1
+            runner["busy_seconds"] += float(harness.get("duration_seconds") or 0.0)
+        for key, values in timing_values.items():
+            value = (harness.get("timing") or {}).get(key)
+            if value is not None:
+                values.append(float(value))
+
+    total_models = len(json_files) - unreadable
+    passed = counts["passed"]
+    valid_format = counts["valid-format"]
+    failed = counts["failed"]
+    timeout = counts["service-timeout"]
+    error = counts["service-error"]
 
     # Calculate percentages
     passed_rate = round((passed / total_models) * 100, 1) if total_models > 0 else 0
@@ -289,6 +1610,50 @@ def analyze_existing_test_reports(reports_dir: Path) -> None:
     else:
         runner_version_display = "mixed: " + ", ".join(sorted(runner_versions))
 
+    sorted_durations = sorted(seconds for seconds, _ in durations)
+    duration_percentiles = {
+        f"p{q}": _percentile(sorted_durations, q) for q in (50, 90, 99)
+    }
+    slowest = [
+        {"model_id": model_id, "duration_seconds": seconds}
+        for seconds, model_id in sorted(durations, reverse=True)[:SLOWEST_MODELS_LISTED]
+    ]
+
+    summary = {
+        "total_models": total_models,
+        "unreadable_reports": unreadable,
+        "counts": counts,
+        "rates": {
+            "passed": passed_rate,
+            "valid-format": valid_format_rate,
+            "failed": failed_rate,
+            "service-timeout": timeout_rate,
+            "service-error": error_rate,
+        },
+        "runner_versions": sorted(runner_versions),
+        "durations": {"tested": len(durations), **duration_percentiles},
+        "slowest_models": slowest,
+        "runners": {
+            name: {**runner, "busy_seconds": round(runner["busy_seconds"], 2)}
+            for name, runner in sorted(per_runner.items())
+        },
+        "timing": {
+            key: {
+                "tests": len(values),
+                "total": round(sum(values), 2),
+                **{f"p{q}": _percentile(sorted(values), q) for q in (50, 90, 99)},
+            }
+            for key, values in timing_values.items()
+        },
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+    summary_file = reports_dir / SUMMARY_FILENAME
+    try:
+        with open(summary_file, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+    except Exception as e:
+        print(f"Failed to write {summary_file}: {e}", file=sys.stderr)
+
     # Output variables for GitHub Actions
     print(f"TOTAL_MODELS={total_models}")
     print(f"PASSED={passed}")
@@ -296,12 +1661,20 @@ def analyze_existing_test_reports(reports_dir: Path) -> None:
     print(f"FAILED={failed}")
     print(f"TIMEOUT={timeout}")
     print(f"ERROR={error}")
+    print(f"DEFERRED={counts['deferred']}")
     print(f"PASSED_RATE={passed_rate}")
     print(f"VALID_FORMAT_RATE={valid_format_rate}")
     print(f"FAILED_RATE={failed_rate}")
     print(f"TIMEOUT_RATE={timeout_rate}")
     print(f"ERROR_RATE={error_rate}")
     print(f"RUNNER_VERSION='{runner_version_display.replace(chr(39), '')}'")
+    print(f"UNREADABLE_REPORTS={unreadable}")
+    for name, value in duration_percentiles.items():
+        print(f"DURATION_{name.upper()}={'' if value is None else value}")
+    queue_wait = summary["timing"]["queue_wait_seconds"]["p50"]
+    execution = summary["timing"]["execution_seconds"]["p50"]
+    print(f"QUEUE_WAIT_P50={'' if queue_wait is None else queue_wait}")
+    print(f"EXECUTION_P50={'' if execution is None else execution}")
 
 
 def clear_existing_test_reports(reports_dir: Path) -> None:
@@ -323,6 +1696,50 @@ def clear_existing_test_reports(reports_dir: Path) -> None:
     print(f"Cleared {removed_count} existing JSON report file(s) in: {reports_dir}")
 
 
+async def list_all_children(am, parent_id: str, page_size: int = CLEANUP_PAGE_SIZE, **kwargs):
+    """Yield every child of *parent_id*, fetching ``page_size`` items per call.
+
+    Pages through ``am.list(..., pagination=True)`` by offset until a page
+    comes back short or empty, or the reported ``total`` (if any) is reached.
+    """
+    offset = 0
+    while True:
+        page = await am.list(
+            parent_id=parent_id, offset=offset, limit=page_size, pagination=True, **kwargs
+        )
+        # Servers without pagination support return a plain list.
+        items = page if isinstance(page, list) else page.get("items", [])
+        for item in items:
+            yield item
+        offset += len(items)
+        total = None if isinstance(page, list) else page.get("total")
+        if len(items) < page_size or (total is not None and offset >= total):
+            break
+
+
+async def _find_orphan_reports(am) -> Tuple[List[str], int]:
+    """Return the ids of orphaned ``test-report-<id>`` artifacts and the report count."""
+    # Existing model aliases (committed AND staged), so we never delete a report
+    # for a model that still exists in any form. A failed listing aborts the
+    # sweep rather than risk deleting reports of models it did not see.
+    existing = set()
+    for stage in (False, True):
+        async for it in list_all_children(am, "bioimage-io/bioimage.io", stage=stage):
+            existing.add(it["id"].split("/")[-1])
+
+    orphans = []
+    total = 0
+    async for it in list_all_children(am, "bioimage-io/test-reports"):
+        total += 1
+        alias = it["id"].split("/")[-1]
+        if not alias.startswith("test-report-"):
+            continue  # keep inference-report and other non per-model members
+        model_alias = alias[len("test-report-") :]
+        if model_alias not in existing:
+            orphans.append(it["id"])
+    return orphans, total
+
+
 async def cleanup_orphan_test_reports(dry_run: bool = False) -> None:
     """Delete per-model test reports whose model no longer exists in the zoo.
 
@@ -330,8 +1747,11 @@ async def cleanup_orphan_test_reports(dry_run: bool = False) -> None:
     ``test-report-<id>`` artifact whose ``<id>`` model is not present in
     ``bioimage-io/bioimage.io`` (neither committed nor staged). The consolidated
     ``inference-report`` and any non ``test-report-`` prefixed member are left
-    untouched. Deletion is best-effort: a permission error on one report is
-    logged and the sweep continues.
+    untouched. Both collections are listed page by page, so nothing past a
+    fixed limit is missed. Deletes run ``CLEANUP_CONCURRENCY`` at a time and
+    each is retried ``CLEANUP_DELETE_RETRIES`` times with backoff; a delete
+    that still fails is logged and the sweep continues. A final re-listing
+    reports how many orphans remain.
 
     Args:
         dry_run: If True, only report what would be deleted.
@@ -343,51 +1763,41 @@ async def cleanup_orphan_test_reports(dry_run: bool = False) -> None:
     )
     am = await server.get_service("public/artifact-manager")
 
-    # Existing model aliases (committed AND staged), so we never delete a report
-    # for a model that still exists in any form.
-    existing = set()
-    for stage in (False, True):
-        try:
-            listed = await am.list(
-                parent_id="bioimage-io/bioimage.io",
-                stage=stage,
-                limit=10000,
-                pagination=True,
-            )
-            for it in listed.get("items", []):
-                existing.add(it["id"].split("/")[-1])
-        except Exception as e:  # pragma: no cover - defensive
-            print(f"Warning: failed to list models (stage={stage}): {e}", file=sys.stderr)
-
-    reports = await am.list(
-        parent_id="bioimage-io/test-reports", limit=10000, pagination=True
+    orphans, total_reports = await _find_orphan_reports(am)
+    print(
+        f"Orphan cleanup: {len(orphans)} of {total_reports} test report(s) "
+        "for models no longer in the zoo"
     )
-    orphans = []
-    for it in reports.get("items", []):
-        alias = it["id"].split("/")[-1]
-        if not alias.startswith("test-report-"):
-            continue  # keep inference-report and other non per-model members
-        model_alias = alias[len("test-report-") :]
-        if model_alias not in existing:
-            orphans.append(it["id"])
+    if dry_run:
+        for aid in orphans:
+            print(f"  [dry-run] would delete {aid.split('/')[-1]}")
+        return
+
+    semaphore = asyncio.Semaphore(CLEANUP_CONCURRENCY)
 
+    async def delete(aid: str) -> bool:
+        short = aid.split("/")[-1]
+        async with semaphore:
+            for attempt in range(CLEANUP_DELETE_RETRIES + 1):
+                try:
+                    await am.delete(artifact_id=aid, delete_files=True, recursive=True)
+                    print(f"  deleted {short}")
+                    return True
+                except Exception as e:
+                    if attempt == CLEANUP_DELETE_RETRIES:
+                        print(f"  FAILED to delete {short}: {e}", file=sys.stderr)
+                        return False
+                    await asyncio.sleep(CLEANUP_RETRY_BASE_SECONDS * 2**attempt)
+
+    results = await asyncio.gather(*(delete(aid) for aid in orphans))
+    deleted = sum(results)
+    print(f"Orphan cleanup: deleted {deleted}/{len(orphans)} report(s)")
+
+    remaining, total_reports = await _find_orphan_reports(am)
     print(
-        f"Orphan cleanup: {len(orphans)} test report(s) for models no longer in the zoo"
+        f"Orphan cleanup reconciliation: {len(remaining)} orphan(s) remain "
+        f"among {total_reports} test report(s)"
     )
-    deleted = 0
-    for aid in orphans:
-        short = aid.split("/")[-1]
-        if dry_run:
-            print(f"  [dry-run] would delete {short}")
-            continue
-        try:
-            await am.delete(artifact_id=aid, delete_files=True, recursive=True)
-            deleted += 1
-            print(f"  deleted {short}")
-        except Exception as e:
-            print(f"  FAILED to delete {short}: {e}", file=sys.stderr)
-    if not dry_run:
-        print(f"Orphan cleanup: deleted {deleted}/{len(orphans)} report(s)")
 
 
 def main():
@@ -431,8 +1841,106 @@ def main():
     )
     parser.add_argument(
         "--service-id",
-        default=DEFAULT_SERVICE_ID,
-        help=f"Model-runner service id to test against (default: {DEFAULT_SERVICE_ID})",
+        nargs="+",
+        default=[DEFAULT_SERVICE_ID],
+        help=(
+            "Model-runner service ids or globs to test against; tests are routed "
+            "to the least-loaded one. 'simulate:key=value,...' uses a local "
+            f"simulated runner (default: {DEFAULT_SERVICE_ID})"
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-test models whose artifact or runner version changed since their last report, plus a rotating drift sample",
+    )
+    parser.add_argument(
+        "--drift-fraction",
+        type=float,
+        default=INCREMENTAL_DRIFT_FRACTION,
+        help=f"With --incremental, share of unchanged models re-tested per run (default: {INCREMENTAL_DRIFT_FRACTION})",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        help="Test only shard i of n (1-based, e.g. 2/4), balanced on historical durations",
+    )
+    parser.add_argument(
+        "--durations-from",
+        type=Path,
+        help=(
+            "Reports directory, history database or durations JSON file with historical "
+            "per-model durations for --shard; a history database also sets per-model timeouts"
+        ),
+    )
+    parser.add_argument(
+        "--merge-reports",
+        type=Path,
+        nargs="+",
+        metavar="DIR",
+        help="Merge these report directories (e.g. CI shards) into reports_dir, then exit (or continue with --analyze-reports)",
+    )
+    parser.add_argument(
+        "--save-durations",
+        type=Path,
+        metavar="FILE",
+        help="Write per-model durations from reports_dir (merged with --durations-from) to FILE, then exit",
+    )
+    parser.add_argument(
+        "--history-db",
+        type=Path,
+        default=DEFAULT_HISTORY_DB,
+        help=f"SQLite database that test outcomes are appended to (default: {DEFAULT_HISTORY_DB.name} in the repository root)",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not append test outcomes to the history database",
+    )
+    parser.add_argument(
+        "--record-history",
+        action="store_true",
+        help="Append the reports in reports_dir to the history database, then exit",
+    )
+    parser.add_argument(
+        "--history",
+        choices=["trend", "new-failures", "regressions"],
+        help="Print pass-rate trend, newly failing models or duration regressions from the history database as JSON, then exit",
+    )
+    parser.add_argument(
+        "--history-days",
+        type=int,
+        default=30,
+        help="Number of days covered by --history trend (default: 30)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from the journal in reports_dir: skip completed models and re-attach to in-flight runs",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help=f"Number of test runs kept in flight (default: 1, max: {MAX_TEST_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--timeout-overrides",
+        type=Path,
+        default=DEFAULT_TIMEOUT_OVERRIDES,
+        help=(
+            "JSON file mapping model id to test timeout in seconds, overriding the "
+            f"timeouts derived from history (default: {DEFAULT_TIMEOUT_OVERRIDES.name})"
+        ),
+    )
+    parser.add_argument(
+        "--breaker-threshold",
+        type=int,
+        default=CIRCUIT_BREAKER_THRESHOLD,
+        help=(
+            "Consecutive service timeouts/errors after which submissions to a runner "
+            f"pause until it recovers; 0 disables (default: {CIRCUIT_BREAKER_THRESHOLD})"
+        ),
     )
 
     args = parser.parse_args()
@@ -442,13 +1950,26 @@ def main():
         or Path(__file__).resolve().parent.parent / "bioimageio_test_reports"
     )
 
+    if args.merge_reports:
+        merge_report_dirs(args.merge_reports, reports_dir)
+        if not args.analyze_reports:
+            return
+
     if args.cleanup_orphans:
         asyncio.run(cleanup_orphan_test_reports(dry_run=args.dry_run))
+    elif args.record_history:
+        record_reports_to_history(reports_dir, args.history_db)
+    elif args.history:
+        print_history(args.history_db, args.history, days=args.history_days)
+    elif args.save_durations:
+        save_durations(reports_dir, args.save_durations, previous=args.durations_from)
     elif args.analyze_reports:
         # Set default reports_dir if not provided
         analyze_existing_test_reports(reports_dir)
     else:
-        if args.clear_reports_dir:
+        if args.clear_reports_dir and args.resume:
+            print("Ignoring --clear-reports-dir with --resume", file=sys.stderr)
+        elif args.clear_reports_dir:
             clear_existing_test_reports(reports_dir)
 
         asyncio.run(
@@ -456,7 +1977,16 @@ def main():
                 model_ids=args.model_ids,
                 reports_dir=reports_dir,
                 skip_cache=args.skip_cache,
-                service_id=args.service_id,
+                service_ids=args.service_id,
+                concurrency=args.concurrency,
+                incremental=args.incremental,
+                drift_fraction=args.drift_fraction,
+                shard=args.shard,
+                durations_from=args.durations_from,
+                history_db=None if args.no_history else args.history_db,
+                resume=args.resume,
+                breaker_threshold=args.breaker_threshold,
+                timeout_overrides=args.timeout_overrides,
             )
         )
 
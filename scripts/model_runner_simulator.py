@@ -0,0 +1,328 @@
+"""In-process stand-in for the BioEngine model-runner service.
+
+Implements the parts of the runner API the test tooling uses (``test``,
+``get_test_status``, ``infer``, ``get_infer_status`` and ``get_load``) on top
+of a simulated GPU run queue, so concurrency, polling and scheduling changes
+can be benchmarked and tested offline and reproducibly:
+
+- ``gpu_slots`` runs execute at a time; further runs wait in a FIFO queue
+  and report their 1-based ``queue_position`` (``0`` once running).
+- Run durations are drawn from configurable latency distributions.
+- Submissions beyond ``max_queue`` queued runs are rejected, like Ray
+  Serve's request admission (``handle_request_with_rejection``).
+- Errors, failing tests, hung runs and whole-service outages can be injected.
+
+Outcomes and durations are drawn from a random generator seeded with
+``seed``, the model id and the attempt number, so a model gets the same
+results in every run with the same settings.
+
+Both ``bioengine_model_test.py`` and ``tests/queue-fill.py`` accept a service
+id of the form ``simulate:key=value,...`` (see :meth:`ModelRunnerSimulator.from_spec`)
+in place of a real model-runner service, e.g.::
+
+    python bioengine_model_test.py --model-ids affable-shark ... \\
+        --service-id "simulate:gpu_slots=2,test_latency=lognormal:30:0.5,time_scale=0.01"
+"""
+
+import asyncio
+import math
+import random
+import time
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Service ids starting with this prefix select the simulator.
+SIMULATOR_PREFIX = "simulate:"
+
+# Runner version stamped in simulated test reports.
+SIMULATOR_VERSION = "simulated"
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Sampler for a latency distribution spec (seconds).
+
+    Supported specs: ``const:S``, ``uniform:LOW:HIGH``, ``exp:MEAN`` and
+    ``lognormal:MEDIAN:SIGMA``.
+
+    Raises:
+        ValueError: If *spec* is not one of those.
+    """
+    kind, *params = spec.split(":")
+    try:
+        values = [float(p) for p in params]
+        if kind == "const" and len(values) == 1:
+            return lambda rng: values[0]
+        if kind == "uniform" and len(values) == 2:
+            return lambda rng: rng.uniform(values[0], values[1])
+        if kind == "exp" and len(values) == 1:
+            return lambda rng: rng.expovariate(1 / values[0])
+        if kind == "lognormal" and len(values) == 2:
+            return lambda rng: rng.lognormvariate(math.log(values[0]), values[1])
+    except (ValueError, ZeroDivisionError):
+        pass
+    raise ValueError(f"Invalid latency distribution '{spec}'")
+
+
+class _Run:
+    __slots__ = (
+        "kind",
+        "model_id",
+        "duration",
+        "outcome",
+        "payload",
+        "submitted_at",
+        "started_at",
+        "completed_at",
+        "result",
+    )
+
+    def __init__(self, kind: str, model_id: str, duration: float, outcome: str, payload) -> None:
+        self.kind = kind
+        self.model_id = model_id
+        self.duration = duration
+        self.outcome = outcome
+        self.payload = payload
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.completed_at: Optional[float] = None
+        self.result = None
+
+
+class ModelRunnerSimulator:
+    """Simulated model-runner service with a shared test/infer run queue.
+
+    Args:
+        gpu_slots: Runs executed concurrently.
+        max_queue: Queued (not yet running) runs accepted before new
+            submissions are rejected.
+        test_latency: Latency spec (see :func:`parse_latency`) of ``test`` runs.
+        infer_latency: Latency spec of ``infer`` runs.
+        rpc_latency: Latency spec added to every call.
+        fail_rate: Share of tests whose report has status ``failed``.
+        valid_format_rate: Share of tests reported as ``valid-format``.
+        error_rate: Share of runs whose result is an ``error``.
+        hang_rate: Share of runs that never produce a result.
+        outages: ``(start, end)`` windows, in seconds since creation, during
+            which every call raises ``ConnectionError``.
+        time_scale: Factor applied to all simulated durations.
+        seed: Seed of the per-model random generators.
+    """
+
+    def __init__(
+        self,
+        gpu_slots: int = 2,
+        max_queue: int = 64,
+        test_latency: str = "lognormal:30:0.5",
+        infer_latency: str = "lognormal:10:0.3",
+        rpc_latency: str = "const:0",
+        fail_rate: float = 0.1,
+        valid_format_rate: float = 0.0,
+        error_rate: float = 0.0,
+        hang_rate: float = 0.0,
+        outages: Optional[List[Tuple[float, float]]] = None,
+        time_scale: float = 1.0,
+        seed: int = 0,
+    ) -> None:
+        self.gpu_slots = gpu_slots
+        self.max_queue = max_queue
+        self.latency = {
+            "test": parse_latency(test_latency),
+            "infer": parse_latency(infer_latency),
+        }
+        self.rpc_latency = parse_latency(rpc_latency)
+        self.fail_rate = fail_rate
+        self.valid_format_rate = valid_format_rate
+        self.error_rate = error_rate
+        self.hang_rate = hang_rate
+        self.outages = outages or []
+        self.time_scale = time_scale
+        self.seed = seed
+        self.stats = {
+            "rpc_calls": 0,
+            "submitted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "peak_queue": 0,
+        }
+        self._created_at = time.time()
+        self._runs: Dict[str, _Run] = {}
+        self._queue: List[str] = []
+        self._running = 0
+        self._attempts: Dict[Tuple[str, str], int] = {}
+        self._rpc_rng = random.Random(seed)
+        self._tasks: set = set()
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "ModelRunnerSimulator":
+        """Create a simulator from ``key=value,...`` (an optional ``simulate:`` prefix is ignored).
+
+        Keys are the constructor arguments; ``outages`` is given as
+        ``START-END`` windows separated by ``;``. A ``name`` key is accepted
+        and ignored, so several otherwise identical simulators can be told
+        apart.
+
+        Raises:
+            ValueError: For unknown keys or malformed values.
+        """
+        if spec.startswith(SIMULATOR_PREFIX):
+            spec = spec[len(SIMULATOR_PREFIX):]
+        types = {
+            "gpu_slots": int,
+            "max_queue": int,
+            "test_latency": str,
+            "infer_latency": str,
+            "rpc_latency": str,
+            "fail_rate": float,
+            "valid_format_rate": float,
+            "error_rate": float,
+            "hang_rate": float,
+            "time_scale": float,
+            "seed": int,
+        }
+        kwargs: dict = {}
+        for item in filter(None, spec.split(",")):
+            key, _, value = item.partition("=")
+            key = key.strip()
+            if key == "name":
+                continue
+            if key == "outages":
+                kwargs["outages"] = [
+                    tuple(float(t) for t in window.split("-", 1))
+                    for window in filter(None, value.split(";"))
+                ]
+            elif key in types:
+                kwargs[key] = types[key](value)
+            else:
+                raise ValueError(f"Unknown simulator setting '{key}'")
+        return cls(**kwargs)
+
+    # -- simulation --------------------------------------------------------
+
+    def _rng(self, kind: str, model_id: str) -> random.Random:
+        attempt = self._attempts.get((kind, model_id), 0)
+        self._attempts[(kind, model_id)] = attempt + 1
+        return random.Random(zlib.crc32(f"{self.seed}:{kind}:{model_id}:{attempt}".encode()))
+
+    async def _call(self) -> None:
+        """Account for one RPC: apply latency and outages."""
+        self.stats["rpc_calls"] += 1
+        delay = self.rpc_latency(self._rpc_rng) * self.time_scale
+        if delay > 0:
+            await asyncio.sleep(delay)
+        elapsed = time.time() - self._created_at
+        if any(start <= elapsed < end for start, end in self.outages):
+            raise ConnectionError("Simulated model-runner outage")
+
+    def _submit(self, kind: str, model_id: str, payload=None) -> str:
+        if len(self._queue) >= self.max_queue:
+            self.stats["rejected"] += 1
+            raise RuntimeError(
+                "Request rejected: run queue full (simulated handle_request_with_rejection)"
+            )
+        rng = self._rng(kind, model_id)
+        duration = self.latency[kind](rng) * self.time_scale
+        draw = rng.random()
+        outcome = "ok"
+        for name, rate in (
+            ("error", self.error_rate),
+            ("hang", self.hang_rate),
+            ("failed", self.fail_rate if kind == "test" else 0.0),
+            ("valid-format", self.valid_format_rate if kind == "test" else 0.0),
+        ):
+            if draw < rate:
+                outcome = name
+                break
+            draw -= rate
+        run_id = f"sim-{kind}-{len(self._runs)}"
+        self._runs[run_id] = _Run(kind, model_id, max(0.0, duration), outcome, payload)
+        self._queue.append(run_id)
+        self.stats["submitted"] += 1
+        self.stats["peak_queue"] = max(self.stats["peak_queue"], len(self._queue))
+        self._dispatch()
+        return run_id
+
+    def _dispatch(self) -> None:
+        while self._queue and self._running < self.gpu_slots:
+            run_id = self._queue.pop(0)
+            self._running += 1
+            task = asyncio.get_running_loop().create_task(self._execute(run_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, run_id: str) -> None:
+        run = self._runs[run_id]
+        run.started_at = time.time()
+        try:
+            await asyncio.sleep(run.duration)
+        finally:
+            self._running -= 1
+            self._dispatch()
+        if run.outcome == "hang":
+            return
+        run.completed_at = time.time()
+        self.stats["completed"] += 1
+        if run.outcome == "error":
+            run.result = {"error": f"Simulated runner error for '{run.model_id}'"}
+        elif run.kind == "infer":
+            run.result = {"outputs": run.payload}
+        else:
+            status = "passed" if run.outcome == "ok" else run.outcome
+            run.result = {
+                "id": run.model_id,
+                "status": status,
+                "details": [
+                    {
+                        "name": "simulated test",
+                        "status": status,
+                        "errors": (
+                            [{"msg": "Simulated test failure"}] if status == "failed" else []
+                        ),
+                    }
+                ],
+                "env": [["bioimage-io/model-runner", SIMULATOR_VERSION, "", ""]],
+            }
+
+    def _status(self, run_id: str) -> dict:
+        run = self._runs.get(run_id)
+        if run is None:
+            raise KeyError(f"Unknown run '{run_id}'")
+        queue_position = self._queue.index(run_id) + 1 if run_id in self._queue else 0
+        return {
+            "run": {
+                "queue_position": queue_position,
+                "submitted_at": run.submitted_at,
+                "started_at": run.started_at,
+                "completed_at": run.completed_at,
+            },
+            "result": run.result,
+        }
+
+    # -- runner API --------------------------------------------------------
+
+    async def test(self, model_id: str, stage: bool = False, cache: str = "check", **kwargs) -> str:
+        """Queue a test of *model_id*; returns its run id."""
+        await self._call()
+        return self._submit("test", model_id)
+
+    async def get_test_status(self, test_run_id: str) -> dict:
+        await self._call()
+        return self._status(test_run_id)
+
+    async def infer(self, model_id: str, inputs=None, cache: str = "check", **kwargs) -> str:
+        """Queue an inference of *model_id*; returns its request id. The result echoes *inputs*."""
+        await self._call()
+        return self._submit("infer", model_id, inputs)
+
+    async def get_infer_status(self, request_id: str) -> dict:
+        await self._call()
+        return self._status(request_id)
+
+    async def get_load(self) -> float:
+        """Running plus queued runs per GPU slot."""
+        await self._call()
+        return (self._running + len(self._queue)) / self.gpu_slots
+
+    def close(self) -> None:
+        """Cancel the runs still executing."""
+        for task in list(self._tasks):
+            task.cancel()
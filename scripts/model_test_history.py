@@ -0,0 +1,228 @@
+"""SQLite history of BioImage.IO model test outcomes.
+
+``bioengine_model_test.py`` appends one row per tested model (status,
+duration, runner version, timestamp, error signature) so that trends,
+newly failing models and duration regressions can be queried without
+re-reading old JSON reports, and so historical durations are available for
+shard balancing and timeouts.
+"""
+
+import re
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+# Statuses counted as a pass when computing pass rates and new failures.
+PASSING_STATUSES = ("passed", "valid-format")
+# Statuses of tests that ran to completion. Only their durations say how
+# long a model takes; service timeouts and errors measure the runner.
+COMPLETED_STATUSES = (*PASSING_STATUSES, "failed")
+
+# Number of most recent outcomes per model used for duration baselines.
+DURATION_WINDOW = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outcomes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    model_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    duration_seconds REAL,
+    runner_version TEXT,
+    tested_at REAL NOT NULL,
+    error_signature TEXT,
+    UNIQUE (model_id, tested_at)
+);
+CREATE INDEX IF NOT EXISTS outcomes_model_time ON outcomes (model_id, tested_at);
+CREATE INDEX IF NOT EXISTS outcomes_time ON outcomes (tested_at);
+"""
+
+# Volatile parts of error messages (addresses, numbers, quoted values,
+# paths) are masked so the same failure maps to the same signature.
+_SIGNATURE_MASKS = [
+    (re.compile(r"0x[0-9a-fA-F]+"), "<addr>"),
+    (re.compile(r"(['\"]).*?\1"), "<str>"),
+    (re.compile(r"(/[\w.\-]+)+"), "<path>"),
+    (re.compile(r"\d+(\.\d+)?"), "<n>"),
+]
+
+
+def error_signature(test_report: dict) -> Optional[str]:
+    """Short normalised signature of the first error in *test_report*.
+
+    Uses the last non-empty line of the first error message (for a
+    traceback, the exception line). Returns None for reports without errors.
+    """
+    for detail in test_report.get("details", []) or []:
+        for error in (detail or {}).get("errors", []) or []:
+            msg = str((error or {}).get("msg", "")).strip()
+            if not msg:
+                continue
+            line = [ln for ln in msg.splitlines() if ln.strip()][-1].strip()
+            for pattern, repl in _SIGNATURE_MASKS:
+                line = pattern.sub(repl, line)
+            return line[:200]
+    return None
+
+
+class TestHistory:
+    """Append-only store of model test outcomes backed by SQLite."""
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "TestHistory":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def record(
+        self,
+        model_id: str,
+        status: str,
+        duration_seconds: Optional[float] = None,
+        runner_version: Optional[str] = None,
+        tested_at: Optional[float] = None,
+        signature: Optional[str] = None,
+    ) -> None:
+        """Append one outcome; re-recording the same (model, time) is a no-op."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO outcomes (model_id, status, duration_seconds,"
+                " runner_version, tested_at, error_signature) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    model_id,
+                    status,
+                    duration_seconds,
+                    runner_version,
+                    time.time() if tested_at is None else tested_at,
+                    signature,
+                ),
+            )
+
+    def durations(
+        self, window: int = DURATION_WINDOW, statuses: Optional[Sequence[str]] = None
+    ) -> Dict[str, List[float]]:
+        """Last *window* recorded durations per model, oldest first.
+
+        With *statuses*, only outcomes with one of those statuses count.
+        """
+        status_filter = ""
+        if statuses is not None:
+            status_filter = f" AND status IN ({', '.join('?' for _ in statuses)})"
+        rows = self._conn.execute(
+            "SELECT model_id, duration_seconds FROM ("
+            " SELECT model_id, duration_seconds, tested_at, ROW_NUMBER() OVER ("
+            "  PARTITION BY model_id ORDER BY tested_at DESC) AS n"
+            f" FROM outcomes WHERE duration_seconds IS NOT NULL{status_filter}"
+            ") WHERE n <= ? ORDER BY model_id, tested_at",
+            (*(statuses or ()), window),
+        )
+        durations: Dict[str, List[float]] = {}
+        for model_id, seconds in rows:
+            durations.setdefault(model_id, []).append(seconds)
+        return durations
+
+    def median_durations(self, window: int = DURATION_WINDOW) -> Dict[str, float]:
+        """Median of the last *window* completed-test durations per model."""
+        durations = self.durations(window, statuses=COMPLETED_STATUSES)
+        return {m: statistics.median(d) for m, d in durations.items()}
+
+    def pass_rate_trend(self, days: int = 30) -> List[dict]:
+        """Per-day pass rate over the last *days* days, oldest first."""
+        since = time.time() - days * 86400
+        placeholders = ", ".join("?" for _ in PASSING_STATUSES)
+        rows = self._conn.execute(
+            "SELECT date(tested_at, 'unixepoch') AS day, COUNT(*),"
+            f" SUM(status IN ({placeholders}))"
+            " FROM outcomes WHERE tested_at >= ? GROUP BY day ORDER BY day",
+            (*PASSING_STATUSES, since),
+        )
+        return [
+            {
+                "day": day,
+                "tested": tested,
+                "passed": passed,
+                "pass_rate": round(100 * passed / tested, 1),
+            }
+            for day, tested, passed in rows
+        ]
+
+    def latest(self) -> Dict[str, dict]:
+        """Most recent outcome (status, time and duration) per model."""
+        latest = {}
+        for model_id, rows in self._latest_two().items():
+            status, tested_at, _, duration_seconds = rows[0]
+            latest[model_id] = {
+                "status": status,
+                "tested_at": tested_at,
+                "duration_seconds": duration_seconds,
+            }
+        return latest
+
+    def _latest_two(self) -> Dict[str, List[tuple]]:
+        rows = self._conn.execute(
+            "SELECT model_id, status, tested_at, error_signature, duration_seconds FROM ("
+            " SELECT *, ROW_NUMBER() OVER ("
+            "  PARTITION BY model_id ORDER BY tested_at DESC) AS n FROM outcomes"
+            ") WHERE n <= 2 ORDER BY model_id, tested_at DESC"
+        )
+        latest: Dict[str, List[tuple]] = {}
+        for model_id, *row in rows:
+            latest.setdefault(model_id, []).append(tuple(row))
+        return latest
+
+    def newly_failing(self) -> List[dict]:
+        """Models whose latest outcome fails while the one before passed."""
+        failing = []
+        for model_id, rows in sorted(self._latest_two().items()):
+            if len(rows) < 2:
+                continue
+            (status, tested_at, signature, _), (previous_status, *_) = rows
+            if status not in PASSING_STATUSES and previous_status in PASSING_STATUSES:
+                failing.append(
+                    {
+                        "model_id": model_id,
+                        "status": status,
+                        "previous_status": previous_status,
+                        "tested_at": tested_at,
+                        "error_signature": signature,
+                    }
+                )
+        return failing
+
+    def duration_regressions(
+        self, factor: float = 1.5, min_seconds: float = 5.0, window: int = DURATION_WINDOW
+    ) -> List[dict]:
+        """Models whose latest duration exceeds *factor* x their earlier median.
+
+        Only completed tests (``COMPLETED_STATUSES``) count, so timeouts and
+        runner outages are not reported as regressions. The baseline is the
+        median of up to *window* earlier durations; regressions of less than
+        *min_seconds* are ignored as noise. Sorted by slowdown, largest first.
+        """
+        regressions = []
+        for model_id, durations in self.durations(window + 1, COMPLETED_STATUSES).items():
+            if len(durations) < 2:
+                continue
+            latest, baseline = durations[-1], statistics.median(durations[:-1])
+            if latest > baseline * factor and latest - baseline >= min_seconds:
+                regressions.append(
+                    {
+                        "model_id": model_id,
+                        "latest_seconds": round(latest, 2),
+                        "baseline_seconds": round(baseline, 2),
+                        "ratio": round(latest / baseline, 2) if baseline else None,
+                    }
+                )
+        return sorted(regressions, key=lambda r: -(r["latest_seconds"] - r["baseline_seconds"]))
@@ -880,9 +880,9 @@ print("Service registered successfully", end='')
     if (!dataServiceRef.current) return;
     setUploadingStems((prev) => new Set(prev).add(item.stem));
     try {
-      await dataServiceRef.current.upload_image(`${item.stem}.${item.format}`);
+      const result = await dataServiceRef.current.upload_image(`${item.stem}.${item.format}`);
       setLocalImages((prev) => prev.filter((i) => i.stem !== item.stem));
-      setImages((prev) => [...(prev ?? []), { stem: item.stem, name: `${item.stem}.png` }]);
+      setImages((prev) => [...(prev ?? []), { stem: item.stem, name: result?.name ?? `${item.stem}.png` }]);
     } catch (err) {
       setError(`Failed to upload "${item.stem}": ${(err as Error).message || 'unknown error'}`);
     } finally {
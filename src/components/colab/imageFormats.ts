@@ -1,7 +1,8 @@
 /**
  * Supported local image file extensions for dataset import.
  * Mirrors the `ImageFormat` enum in `public/colab_service.py` — keep in sync
- * if that enum ever changes.
+ * if that enum ever changes. `zarr` is the one exception: an OME-Zarr store
+ * is a directory, so it never matches a file extension here.
  */
 export const SUPPORTED_IMAGE_EXTENSIONS: string[] = [
   '.jpg',
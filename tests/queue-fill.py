@@ -13,19 +13,25 @@ holds a GPU slot ~12s; with 2 GPU slots, POOL=8 keeps ~2 running (pos0) and
 ran 8 concurrent cleanly).
 
 Env:
-  HYPHA_TOKEN     - hypha token
+  HYPHA_TOKEN     - hypha token (not needed with a simulated runner)
   FILL_SECONDS    - how long to hold pressure (default 180)
   FILL_POOL       - fixed concurrent in-flight infers (default 8)
-  RUNNER_SERVICE  - service id (default: KTH 1.15.32 worker)
+  RUNNER_SERVICE  - service id (default: KTH 1.15.32 worker); a
+                    "simulate:key=value,..." id uses the local simulator in
+                    scripts/model_runner_simulator.py instead, e.g.
+                    RUNNER_SERVICE="simulate:gpu_slots=2,infer_latency=const:12,max_queue=6"
   FILL_MODEL      - model id (default affable-shark)
 """
 import asyncio
 import os
+import sys
 import time
 import numpy as np
 from hypha_rpc import connect_to_server
 
-TOKEN = os.environ["HYPHA_TOKEN"]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+from model_runner_simulator import SIMULATOR_PREFIX, ModelRunnerSimulator  # noqa: E402
+
 SECONDS = float(os.environ.get("FILL_SECONDS", "180"))
 POOL = int(os.environ.get("FILL_POOL", "8"))
 MODEL = os.environ.get("FILL_MODEL", "affable-shark")
@@ -40,8 +46,13 @@ RUNNER_SERVICE = os.environ.get(
 
 
 async def main():
-    server = await connect_to_server({"server_url": "https://hypha.aicell.io", "token": TOKEN})
-    runner = await server.get_service(RUNNER_SERVICE, {"mode": "select:min:get_load"})
+    server = None
+    if RUNNER_SERVICE.startswith(SIMULATOR_PREFIX):
+        runner = ModelRunnerSimulator.from_spec(RUNNER_SERVICE)
+    else:
+        token = os.environ["HYPHA_TOKEN"]
+        server = await connect_to_server({"server_url": "https://hypha.aicell.io", "token": token})
+        runner = await server.get_service(RUNNER_SERVICE, {"mode": "select:min:get_load"})
     arr = np.random.rand(1, 1, 256, 256).astype("float32")
     print(f"[fill] runner service: {RUNNER_SERVICE}", flush=True)
     print(f"[fill] holding a fixed pool of {POOL} in-flight {MODEL} infers for {SECONDS}s", flush=True)
@@ -90,7 +101,11 @@ async def main():
     stop = True
     rep.cancel()
     print(f"[fill] done: completed={completed} errors={errors}", flush=True)
-    await server.disconnect()
+    if server is None:
+        print(f"[fill] simulator: {runner.stats}", flush=True)
+        runner.close()
+    else:
+        await server.disconnect()
 
 
 if __name__ == "__main__":